@@ -1,18 +1,44 @@
+import html
+import json
 import logging
 import os
-import requests
-import subprocess
-import tempfile
+import re
+import sys
+from functools import cache
+import time
 from PyQt6 import QtWidgets, QtCore
 from typing import Optional
 from downloads import DownloadWorker
 from update_dialog import UpdateDialog
-from utils import resource_path, schedule_ui_task
-from downloads import DownloadWorker  # Import the centralized DownloadWorker
+from utils import resource_path, schedule_ui_task, get_app_data_dir, size_unit
+from constants import get_version
 import strings
 
 logger = logging.getLogger(__name__)
 
+ETAG_CACHE_FILENAME = "etag_cache.json"
+RELEASE_CACHE_TTL = 300  # seconds to reuse the parsed latest release
+
+# Bullet items in a release body, e.g. GitHub's generated "* Fix thing by @user in ..."
+_RELEASE_NOTE_ITEM_RE = re.compile(r"^\s*[-*]\s+(.+?)\s*$", re.MULTILINE)
+_FULL_CHANGELOG_LINE_RE = re.compile(r"^.*Full Changelog.*(?:\r?\n|$)", re.MULTILINE)
+_FULL_CHANGELOG_URL_RE = re.compile(r"Full Changelog\**:?\**\s*(https://\S+)")
+
+@cache
+def _parse_version(version_str: str) -> tuple[int, ...]:
+    """Parse a tag such as "v1.2.3-45" into a comparable tuple; results are cached per string."""
+    version_str = version_str.lstrip("v")
+    parts = version_str.split("-")
+    main = parts[0]
+    build = parts[1] if len(parts) > 1 else None
+    
+    main_nums = [int(x) for x in main.split(".")]
+    if build and build.isdigit():
+        main_nums.append(int(build))
+        
+    return tuple(main_nums)
+
+
 class ApplicationUpdater:
     """Manages application updates from GitHub releases."""
     
@@ -22,52 +48,135 @@ class ApplicationUpdater:
         self.repo_owner = "tv2-magnus"
         self.repo_name = "VIPrestore"
         self.current_version = self._get_current_version()
-        self.worker = None
-        self.thread = None
-        self.download_thread = None
+        self._current_version_tuple = _parse_version(self.current_version)
         self.download_worker = None
+        self.progress_timer = None
+        self._last_progress_percent = -1
+        self._progress_unit = None
+        self._session = None
+        self._etag_cache_file = get_app_data_dir() / ETAG_CACHE_FILENAME
+        self._etag_cache = self._load_etag_cache()
+        self._release_cache = {"ts": 0.0, "data": None}
     
+    @property
+    def session(self):
+        """Pooled HTTP session shared by all GitHub API requests, created on first use."""
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+
+    def _create_session(self):
+        """Create a pooled HTTP session shared by all GitHub API requests."""
+        # Imported lazily so startup doesn't pay for requests/urllib3 until the first network call
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+        session.headers.update({
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "viprestore-updater"
+        })
+        return session
+
+    def _load_etag_cache(self) -> dict:
+        """Load the persisted ETag cache, returning an empty cache on any error."""
+        try:
+            with open(self._etag_cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Could not read ETag cache: {e}")
+            return {}
+
+    def _save_etag_cache(self) -> None:
+        """Atomically write the ETag cache to disk."""
+        tmp_path = f"{self._etag_cache_file}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._etag_cache, f)
+            os.replace(tmp_path, self._etag_cache_file)
+        except Exception as e:
+            logger.warning(f"Could not write ETag cache: {e}")
+
+    def _conditional_get(self, url: str, headers: Optional[dict] = None):
+        """
+        GET a GitHub API URL using ETag/Last-Modified validators.
+        A 304 Not Modified response is answered from the local cache and
+        does not count against the GitHub rate limit.
+        
+        Args:
+            url: URL to fetch
+            headers: Optional request headers
+            
+        Returns:
+            The decoded JSON body
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        headers = dict(headers or {})
+        cached = self._etag_cache.get(url)
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = self.session.get(url, headers=headers, timeout=10)
+        logger.debug(f"Response status: {response.status_code}")
+
+        if response.status_code == 304 and cached:
+            logger.debug(f"Not modified, using cached response for: {url}")
+            return json.loads(cached["body"])
+
+        response.raise_for_status()
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._etag_cache[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": response.text,
+            }
+            self._save_etag_cache()
+
+        return response.json()
+
     def _get_current_version(self) -> str:
         """Get the current version from constants module."""
-        from constants import get_version
         version = get_version()
         logger.debug(f"Current version: {version}")
         return version
     
-    def parse_version(self, version_str: str) -> tuple:
-        version_str = version_str.lstrip("v")
-        parts = version_str.split("-")
-        main = parts[0]
-        build = parts[1] if len(parts) > 1 else None
-        
-        main_nums = [int(x) for x in main.split(".")]
-        if build and build.isdigit():
-            main_nums.append(int(build))
-            
-        return tuple(main_nums)
-
     def check_for_update(self) -> Optional[dict]:
-        url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/releases"
-        headers = {
-            "Accept": "application/vnd.github+json",
-            "User-Agent": "viprestore-updater"
-        }
+        # Only the newest release is used; per_page=1 (rather than /releases/latest)
+        # keeps pre-releases eligible while avoiding the full release history
+        url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/releases?per_page=1"
 
-        logger.debug(f"Checking for update at: {url}")
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            logger.debug(f"Response status: {response.status_code}")
-            response.raise_for_status()
+            cached = self._release_cache
+            if cached["data"] is not None and time.monotonic() - cached["ts"] < RELEASE_CACHE_TTL:
+                logger.debug("Using cached latest release")
+                latest = cached["data"]
+            else:
+                logger.debug(f"Checking for update at: {url}")
+                data = self._conditional_get(url)
+                if not data:
+                    logger.debug("No releases found (empty JSON).")
+                    return None
+
+                latest = data[0]
+                self._release_cache = {"ts": time.monotonic(), "data": latest}
 
-            data = response.json()
-            if not data:
-                logger.debug("No releases found (empty JSON).")
-                return None
-
-            latest = data[0]
             latest_version = latest.get("tag_name", "").strip()
 
-            if self.parse_version(latest_version) > self.parse_version(self.current_version):
+            if _parse_version(latest_version) > self._current_version_tuple:
                 logger.debug(f"Update available: {latest_version} > {self.current_version}")
                 return latest
 
@@ -82,13 +191,11 @@ class ApplicationUpdater:
         logger.debug(f"Fetching compare data from: {compare_api_url}")
 
         try:
-            resp = requests.get(compare_api_url, timeout=10)
-            resp.raise_for_status()
+            data = self._conditional_get(compare_api_url)
         except Exception as e:
             logger.warning(f"Failed to fetch compare commits: {e}")
             return "(Could not fetch commit list.)"
 
-        data = resp.json()
         commits = data.get("commits", [])
         if not commits:
             return "No commits found between these versions."
@@ -104,23 +211,55 @@ class ApplicationUpdater:
         result = "<p><b>Commits in this release:</b></p>\n" + "<br>".join(lines)
         return result
 
+    def release_body_commits_html(self, raw_body: str) -> Optional[str]:
+        """
+        Build the commit list from the release notes themselves, if they contain one.
+        
+        Args:
+            raw_body: Unmodified release body from GitHub
+            
+        Returns:
+            HTML for the update dialog, or None if the compare API must be queried
+        """
+        items = _RELEASE_NOTE_ITEM_RE.findall(self.sanitize_release_body(raw_body))
+        changelog = _FULL_CHANGELOG_URL_RE.search(raw_body)
+        if not items and not changelog:
+            return None
+
+        parts = []
+        if items:
+            parts.append(
+                "<p><b>Changes in this release:</b></p>\n"
+                + "<br>".join(f"- {html.escape(item)}" for item in items)
+            )
+        if changelog:
+            url = html.escape(changelog.group(1), quote=True)
+            parts.append(f'<p><a href="{url}">Full Changelog</a></p>')
+        return "\n".join(parts)
+
+    def get_commits_html(self, update_info: dict) -> str:
+        """
+        Build the commit list shown in the update dialog.
+        Uses the release notes when they list changes, otherwise queries the compare API.
+        
+        Args:
+            update_info: GitHub release information dictionary
+            
+        Returns:
+            HTML for the update dialog
+        """
+        commits_html = self.release_body_commits_html(update_info.get("body") or "")
+        if commits_html is not None:
+            return commits_html
+
+        # Build compare tags
+        current_tag = self.current_version if self.current_version.startswith("v") else f"v{self.current_version}"
+        head_tag = update_info.get("tag_name", "").strip()
+        return self.fetch_compare_commits(current_tag, head_tag)
+
     def sanitize_release_body(self, body: str) -> str:
-        lines = body.splitlines()
-        filtered = []
-        for ln in lines:
-            if "Full Changelog" in ln:
-                continue  # skip that line
-            filtered.append(ln)
-        return "\n".join(filtered)
-
-    def human_readable_size(self, size_in_bytes: int) -> str:
-        units = ["B", "KB", "MB", "GB", "TB"]
-        size = float(size_in_bytes)
-        idx = 0
-        while size >= 1024 and idx < len(units) - 1:
-            size /= 1024
-            idx += 1
-        return f"{size:.2f} {units[idx]}"
+        # Drop every "Full Changelog" line in a single regex pass
+        return _FULL_CHANGELOG_LINE_RE.sub("", body)
 
     def check_for_updates_async(self):
         """Check for updates asynchronously while handling splash screen properly."""
@@ -134,25 +273,15 @@ class ApplicationUpdater:
         else:
             logger.debug("No splash screen or min_splash_time not defined")
         
-        # Run the check in a separate thread
-        self.thread = QtCore.QThread()
-        self.worker = UpdateCheckWorker(self)
-        self.worker.moveToThread(self.thread)
-        
-        # Connect signals
-        self.thread.started.connect(self.worker.process)
-        self.worker.finished.connect(self.on_update_check_complete)
-        self.worker.error.connect(self.on_update_check_error)
+        # Run the check on a pooled worker thread
+        runnable = UpdateCheckRunnable(self)
+        runnable.signals.finished.connect(self.on_update_check_complete)
+        runnable.signals.error.connect(self.on_update_check_error)
         
-        # Start the thread
-        logger.debug("Starting update check thread")
-        self.thread.start()
+        logger.debug("Starting update check task")
+        QtCore.QThreadPool.globalInstance().start(runnable)
     
-    def on_update_check_complete(self, update_info):
-        # Clean up thread
-        self.thread.quit()
-        self.thread.wait()
-        
+    def on_update_check_complete(self, update_info, commits_html):
         # Don't close splash directly - finish() was called in check_for_updates_async
         
         if not update_info:
@@ -162,36 +291,21 @@ class ApplicationUpdater:
             return
         
         # Show update dialog
-        self.show_update_dialog(update_info)
+        self.show_update_dialog(update_info, commits_html)
     
     def on_update_check_error(self, error_message):
         logger.error(f"Update check error: {error_message}")
         
-        # Clean up thread
-        self.thread.quit()
-        self.thread.wait()
-        
         # Don't close splash directly - finish() was called in check_for_updates_async
         
         # Show main window if not already visible
         if self.parent and not self.parent.isVisible():
             self.parent.show()
     
-    def show_update_dialog(self, update_info):
+    def show_update_dialog(self, update_info, commits_html: str):
         latest_version = update_info.get("tag_name", "").strip()
         
-        # Get release body and clean it
-        raw_body = update_info.get("body", "")
-        release_body = self.sanitize_release_body(raw_body)
-        
-        # Build compare tags
-        current_tag = self.current_version if self.current_version.startswith("v") else f"v{self.current_version}"
-        head_tag = latest_version
-        
-        # Fetch commits from GitHub compare
-        commits_html = self.fetch_compare_commits(current_tag, head_tag)
-        
-        # Show UpdateDialog
+        # Show UpdateDialog; the commit list was already fetched by the update check task
         dlg = UpdateDialog(
             current_version=self.current_version,
             new_version=latest_version,
@@ -229,6 +343,7 @@ class ApplicationUpdater:
         logger.debug(f"Downloading from: {asset_api_url}")
 
         headers = {
+            "Accept": "application/octet-stream",
             "User-Agent": "viprestore-updater"
         }
 
@@ -243,62 +358,88 @@ class ApplicationUpdater:
         # Force the dialog to repaint
         QtWidgets.QApplication.processEvents()
 
-        # Create worker and thread and store as instance variables to prevent garbage collection
-        self.download_thread = QtCore.QThread()
+        # Store the worker as an instance variable to prevent garbage collection
         self.download_worker = DownloadWorker(asset_api_url, filename, headers)
-        self.download_worker.moveToThread(self.download_thread)
+
+        # Poll progress from the UI thread at 10 Hz instead of signalling per chunk
+        self._last_progress_percent = -1
+        self._progress_unit = None
+        self.progress_timer = QtCore.QTimer(self.parent)
+        self.progress_timer.setInterval(100)
+        self.progress_timer.timeout.connect(lambda: self.update_download_progress(progress))
 
         # Connect signals
-        self.download_worker.progressChanged.connect(progress.setValue)
-        self.download_worker.statusTextChanged.connect(progress.setLabelText)
         self.download_worker.errorOccurred.connect(
-            lambda msg: self.handle_download_error(msg, progress, self.download_thread))
+            lambda msg: self.handle_download_error(msg, progress))
         self.download_worker.finished.connect(
-            lambda path: self.handle_download_finished(path, progress, self.download_thread))
+            lambda path: self.handle_download_finished(path, progress))
         self.download_worker.cancelled.connect(
-            lambda: self.handle_download_cancelled(progress, self.download_thread))
+            lambda: self.handle_download_cancelled(progress))
 
         # Connect cancel button to handler
         progress.canceled.connect(lambda: self.handle_progress_cancelled(progress))
 
-        # When the thread starts, call the worker's start_download()
-        self.download_thread.started.connect(self.download_worker.start_download)
+        # Run the download on a pooled worker thread
+        logger.debug("Starting download task")
+        self.download_worker.submit()
+        self.progress_timer.start()
 
-        # Start the thread
-        logger.debug("Starting download thread")
-        self.download_thread.start()
+    def update_download_progress(self, progress):
+        """Refresh the progress dialog from the worker's byte counters."""
+        total = self.download_worker.total_size
+        if total <= 0:
+            return
+        downloaded = self.download_worker.downloaded_size
+        percent = downloaded * 100 // total
+        # Skip the repaint and label formatting while the percentage hasn't moved
+        if percent == self._last_progress_percent:
+            return
+        self._last_progress_percent = percent
+        if self._progress_unit is None:
+            # Both sizes are shown in the total's unit, so it only has to be chosen once
+            denom, unit = size_unit(total)
+            self._progress_unit = (denom, unit, f"{total / denom:.2f} {unit}")
+        denom, unit, total_text = self._progress_unit
+        progress.setValue(percent)
+        progress.setLabelText(f"Downloading... {downloaded / denom:.2f} {unit} of {total_text}")
+
+    def stop_progress_timer(self):
+        """Stop polling download progress."""
+        if self.progress_timer is not None:
+            self.progress_timer.stop()
+            self.progress_timer.deleteLater()
+            self.progress_timer = None
 
     def handle_progress_cancelled(self, progress):
         """Handle when the user clicks the cancel button on the progress dialog."""
+        self.stop_progress_timer()
         progress.setCancelButtonText("Cancelling...")
         progress.setLabelText("Cancelling download...")
         progress.setCancelButton(None)  # Disable the cancel button
         self.download_worker.cancel_download()
 
-    def handle_download_cancelled(self, progress_dialog, thread):
+    def handle_download_cancelled(self, progress_dialog):
         """Handle when the download has been successfully cancelled."""
         logger.debug("Download cancellation complete")
+        self.stop_progress_timer()
         progress_dialog.close()
-        thread.quit()
-        thread.wait()
         self.parent.show()
 
-    def handle_download_error(self, error_message: str, progress_dialog: QtWidgets.QProgressDialog, thread: QtCore.QThread):
+    def handle_download_error(self, error_message: str, progress_dialog: QtWidgets.QProgressDialog):
+        self.stop_progress_timer()
         QtWidgets.QMessageBox.critical(
             self.parent, 
             strings.DIALOG_TITLE_ERROR, 
             f"Download failed: {error_message}"
         )
         progress_dialog.close()
-        thread.quit()
-        thread.wait()
         self.parent.show()
 
-    def handle_download_finished(self, file_path: str, progress_dialog: QtWidgets.QProgressDialog, thread: QtCore.QThread):
+    def handle_download_finished(self, file_path: str, progress_dialog: QtWidgets.QProgressDialog):
+        self.stop_progress_timer()
         progress_dialog.setValue(100)
         progress_dialog.close()
-        thread.quit()
-        thread.wait()
+        self._release_cache = {"ts": 0.0, "data": None}
 
         reply = QtWidgets.QMessageBox.question(
             self.parent,
@@ -308,33 +449,74 @@ class ApplicationUpdater:
         )
         if reply == QtWidgets.QMessageBox.StandardButton.Yes:
             logger.debug("Launching the downloaded update.")
-            subprocess.Popen([file_path], shell=True)
+            try:
+                self.launch_installer(file_path)
+            except OSError as e:
+                logger.error(f"Failed to launch installer: {e}")
+                QtWidgets.QMessageBox.critical(
+                    self.parent,
+                    strings.DIALOG_TITLE_ERROR,
+                    f"Could not start the installer: {e}"
+                )
+                self.parent.show()
+                return
+            # The installer runs detached, so it survives the application exiting
             QtWidgets.QApplication.quit()
-            import sys
             sys.exit(0)
         else:
             # If user chooses not to install now, show the main window
             self.parent.show()
 
+    def launch_installer(self, file_path: str) -> None:
+        """
+        Start the downloaded installer as a detached process without an intermediate shell.
+        
+        Args:
+            file_path: Path to the downloaded installer
+            
+        Raises:
+            OSError: If the installer could not be started
+        """
+        import subprocess
+
+        if sys.platform == "win32":
+            flags = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+            try:
+                subprocess.Popen([file_path], creationflags=flags, close_fds=True)
+            except OSError as e:
+                # ERROR_ELEVATION_REQUIRED: let the shell show the UAC prompt instead
+                if getattr(e, "winerror", None) != 740:
+                    raise
+                os.startfile(file_path)
+        else:
+            os.chmod(file_path, 0o755)
+            subprocess.Popen([file_path], start_new_session=True, close_fds=True)
 
-class UpdateCheckWorker(QtCore.QObject):
-    """Worker for checking updates in a background thread."""
+
+class UpdateCheckSignals(QtCore.QObject):
+    """Signals emitted by UpdateCheckRunnable."""
     
-    finished = QtCore.pyqtSignal(object)  # Signal emits update_info or None
+    finished = QtCore.pyqtSignal(object, object)  # Signal emits update_info or None, and commits HTML
     error = QtCore.pyqtSignal(str)  # Signal emits error message
+
+
+class UpdateCheckRunnable(QtCore.QRunnable):
+    """Task for checking updates on a QThreadPool worker thread."""
     
     def __init__(self, updater):
         super().__init__()
         self.updater = updater
+        self.signals = UpdateCheckSignals()
     
-    @QtCore.pyqtSlot()
-    def process(self):
-        """Check for updates and emit result."""
-        logger.debug("UpdateCheckWorker process started")
+    def run(self):
+        """Check for updates and, if one is available, fetch its commit list before emitting."""
+        logger.debug("UpdateCheckRunnable started")
         try:
             update_info = self.updater.check_for_update()
             logger.debug(f"Update check completed: {update_info is not None}")
-            self.finished.emit(update_info)
+            commits_html = self.updater.get_commits_html(update_info) if update_info else None
+            self.signals.finished.emit(update_info, commits_html)
         except Exception as e:
-            logger.error(f"Error in update check worker: {e}")
-            self.error.emit(str(e))
\ No newline at end of file
+            logger.error(f"Error in update check task: {e}")
+            self.signals.error.emit(str(e))
+
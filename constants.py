@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from utils import resource_path
 
 logger = logging.getLogger(__name__)
@@ -7,10 +8,12 @@ logger = logging.getLogger(__name__)
 APP_NAME = "VIPrestore"
 APP_VERSION_FILE = "version.txt"
 
+@lru_cache(maxsize=1)
 def get_version():
     """
     Get the application version from the version file.
     This is the centralized version reading function to be used throughout the application.
+    The file is read once and the result is cached for the lifetime of the process.
     
     Returns:
         str: Version string, or "0.0.0" if version file can't be read
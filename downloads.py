@@ -3,21 +3,66 @@ downloads.py - Centralized download management for VIPrestore
 """
 
 import os
-import tempfile
+import shutil
 import logging
-import requests
 from PyQt6 import QtCore
 from typing import Dict
 
 logger = logging.getLogger(__name__)
 
+# Shared across downloads so repeat downloads reuse kept-alive TCP/TLS connections
+_POOL = None
+
+
+def _get_pool():
+    """Return the module-wide urllib3 PoolManager, creating it on first use."""
+    global _POOL
+    if _POOL is None:
+        import urllib3
+        _POOL = urllib3.PoolManager(num_pools=4, maxsize=8)
+    return _POOL
+
+
+class _DownloadCancelled(Exception):
+    """Raised inside the copy loop to abort a cancelled download."""
+
+
+class _ProgressWriter:
+    """File wrapper that records download progress and aborts the copy on cancellation."""
+    
+    def __init__(self, f, worker, encoded_response=None):
+        """
+        Args:
+            f: Destination file object
+            worker: DownloadWorker whose progress counter is updated
+            encoded_response: Response to take wire byte counts from when it is
+                content-encoded, since content-length is then the compressed size
+        """
+        self._write = f.write
+        self._worker = worker
+        self._encoded_response = encoded_response
+    
+    def write(self, data):
+        worker = self._worker
+        if worker._cancelled:
+            raise _DownloadCancelled()
+        n = self._write(data)
+        # Only this thread writes the counter; the UI's progress timer just reads it
+        if self._encoded_response is not None:
+            worker.downloaded_size = self._encoded_response.tell()
+        else:
+            worker.downloaded_size += len(data)
+        return n
+
+
 class DownloadWorker(QtCore.QObject):
-    """Worker object that handles file downloads in a separate thread."""
+    """
+    Worker object that handles file downloads in a separate thread.
+    Progress is not signalled per chunk; the UI polls downloaded_size and total_size.
+    """
     
     # Signals
     cancelled = QtCore.pyqtSignal()
-    progressChanged = QtCore.pyqtSignal(int)  # Percent complete
-    statusTextChanged = QtCore.pyqtSignal(str)  # Status text
     finished = QtCore.pyqtSignal(str)  # File path on success
     errorOccurred = QtCore.pyqtSignal(str)  # Error message
     
@@ -34,109 +79,171 @@ class DownloadWorker(QtCore.QObject):
         super().__init__(parent)
         self.download_url = download_url
         self.filename = filename
-        self.headers = headers or {}
+        self.headers = dict(headers or {})
+        # Binary assets gain nothing from transfer compression, and an encoded body
+        # would make content-length disagree with the decoded byte count
+        self.headers.setdefault("Accept-Encoding", "identity")
+        self.downloaded_size = 0
+        self.total_size = 0
         self._cancelled = False
         self._temp_dir = None
         self._file_path = None
+        self._partial_path = None
         
     def get_file_path(self) -> str:
         """
         Get the full path where the file will be downloaded.
-        Creates the temp directory if needed.
+        Creates the temp directory if needed. Data is streamed into a
+        sibling ".part" file and only renamed to this path once complete.
         
         Returns:
             str: Full path to the download target
         """
         if self._file_path is None:
+            import tempfile
             self._temp_dir = tempfile.gettempdir()
             self._file_path = os.path.join(self._temp_dir, self.filename)
+            self._partial_path = self._file_path + ".part"
         return self._file_path
     
     @staticmethod
-    def human_readable_size(size_in_bytes: int) -> str:
+    def _open_for_sequential_write(file_path: str):
         """
-        Convert bytes to a human-readable string.
+        Open the target file for writing with sequential-access hints.
+        Uses O_SEQUENTIAL on Windows and posix_fadvise on POSIX where available.
         
         Args:
-            size_in_bytes: Size in bytes
+            file_path: Path of the file to create or truncate
             
         Returns:
-            str: Human readable size (e.g., "4.2 MB")
+            Binary file object opened for writing
         """
-        units = ["B", "KB", "MB", "GB", "TB"]
-        size = float(size_in_bytes)
-        idx = 0
-        while size >= 1024 and idx < len(units) - 1:
-            size /= 1024
-            idx += 1
-        return f"{size:.2f} {units[idx]}"
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0) | getattr(os, "O_SEQUENTIAL", 0)
+        fd = os.open(file_path, flags, 0o666)
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError as e:
+                logger.debug("posix_fadvise not supported: %s", e)
+        return os.fdopen(fd, "wb")
+    
+    @staticmethod
+    def _discard(file_path: str):
+        """
+        Delete a partially written download. The handle must already be closed.
+        
+        Args:
+            file_path: Path of the file to remove
+        """
+        try:
+            os.unlink(file_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not remove partial download %s: %s", file_path, e)
     
     @QtCore.pyqtSlot()
     def start_download(self):
-        """Perform the actual download in chunks and emit progress signals."""
+        """Perform the actual download in chunks, updating downloaded_size as it goes."""
+        # Imported lazily so startup doesn't pay for urllib3 until a download happens
+        import urllib3
+
         try:
             file_path = self.get_file_path()
-            logger.debug(f"Starting download to: {file_path}")
+            partial_path = self._partial_path
+            logger.debug("Starting download to: %s", partial_path)
             
-            response = requests.get(
-                self.download_url, 
-                stream=True, 
-                headers=self.headers, 
-                timeout=30
+            response = _get_pool().request(
+                "GET",
+                self.download_url,
+                headers=self.headers,
+                preload_content=False,
+                decode_content=True,
+                timeout=urllib3.Timeout(connect=10, read=30)
             )
-            response.raise_for_status()
+            try:
+                if response.status >= 400:
+                    raise urllib3.exceptions.HTTPError(
+                        f"{response.status} {response.reason} for url: {self.download_url}"
+                    )
+                
+                self.total_size = int(response.headers.get('content-length', 0))
+                chunk_size = 4 * 1024 * 1024  # 4MB chunks
+                
+                # If the server compressed the body anyway, count wire bytes for progress
+                encoding = response.headers.get('content-encoding', 'identity').lower()
+                encoded_response = response if encoding != 'identity' else None
+                
+                # Let shutil drive the read/write loop; the writer wrapper handles
+                # progress accounting and cancellation once per chunk. A kernel copy
+                # (os.sendfile) is not an option: release assets come over TLS, so the
+                # bytes must be decrypted in userspace, and sendfile cannot read from a socket
+                f = self._open_for_sequential_write(partial_path)
+                try:
+                    shutil.copyfileobj(
+                        response, _ProgressWriter(f, self, encoded_response), length=chunk_size
+                    )
+                    f.close()
+                    # Publish the finished file atomically; nothing ever sees a partial installer
+                    os.replace(partial_path, file_path)
+                except _DownloadCancelled:
+                    logger.debug("Download cancelled")
+                    # Close first so the unlink cannot hit a Windows sharing violation
+                    f.close()
+                    self._discard(partial_path)
+                    self.cancelled.emit()
+                    return
+                except BaseException:
+                    f.close()
+                    self._discard(partial_path)
+                    raise
+                
+                # Fully read, so the connection can go back to the pool
+                response.release_conn()
+            finally:
+                # Drops the connection if the body was not read to the end (cancel or error)
+                response.close()
             
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded_size = 0
-            chunk_size = 1024 * 1024  # 1MB chunks
-            
-            # Emit initial progress
-            if total_size > 0:
-                self.statusTextChanged.emit(
-                    f"Downloading... {self.human_readable_size(0)} of "
-                    f"{self.human_readable_size(total_size)}"
-                )
-            
-            with open(file_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    if self._cancelled:
-                        logger.debug("Download cancelled")
-                        f.close()
-                        if os.path.exists(file_path):
-                            os.remove(file_path)
-                        self.cancelled.emit()
-                        return
-                    
-                    if chunk:
-                        f.write(chunk)
-                        downloaded_size += len(chunk)
-                        
-                        if total_size > 0:
-                            percent = int((downloaded_size / total_size) * 100)
-                            self.progressChanged.emit(percent)
-                            
-                            # Update status every 5% for large files
-                            if percent % 5 == 0 or percent >= 100:
-                                self.statusTextChanged.emit(
-                                    f"Downloading... {self.human_readable_size(downloaded_size)} of "
-                                    f"{self.human_readable_size(total_size)}"
-                                )
-            
-            logger.debug(f"Download completed: {file_path}")
-            self.progressChanged.emit(100)
+            logger.debug("Download completed: %s", file_path)
             self.finished.emit(file_path)
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Download request error: {e}")
+        except urllib3.exceptions.HTTPError as e:
+            logger.error("Download request error: %s", e)
             error_msg = f"Download failed: {str(e)}"
             self.errorOccurred.emit(error_msg)
             
         except Exception as e:
-            logger.error(f"Unexpected download error: {e}", exc_info=True)
+            logger.error("Unexpected download error: %s", e, exc_info=True)
             error_msg = f"Unexpected error: {str(e)}"
             self.errorOccurred.emit(error_msg)
     
     def cancel_download(self):
         """Cancel the current download operation."""
         logger.debug("Cancelling download...")
-        self._cancelled = True
\ No newline at end of file
+        self._cancelled = True
+    
+    def submit(self):
+        """Run this download on the shared QThreadPool instead of a dedicated QThread."""
+        pool = QtCore.QThreadPool.globalInstance()
+        # Keep the shared pool bounded on machines with many cores
+        if pool.maxThreadCount() > 8:
+            pool.setMaxThreadCount(8)
+        pool.start(_DownloadRunnable(self))
+
+
+class _DownloadRunnable(QtCore.QRunnable):
+    """Task that runs a DownloadWorker on a QThreadPool worker thread."""
+    
+    def __init__(self, worker: DownloadWorker):
+        """
+        Initialize the download task.
+        
+        Args:
+            worker: DownloadWorker whose signals report progress and completion
+        """
+        super().__init__()
+        self.worker = worker
+    
+    def run(self):
+        """Run the download; cancellation is still requested via worker.cancel_download()."""
+        self.worker.start_download()
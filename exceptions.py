@@ -3,12 +3,19 @@ exceptions.py - Exception handling infrastructure for VIPrestore
 """
 
 import sys
+import time
 import logging
+import requests
 from PyQt6 import QtWidgets, QtCore
 import strings
+from vipclient import VideoIPathClientError
+from service_manager import ServiceManagerError
 
 logger = logging.getLogger(__name__)
 
+# Minimum spacing between full tracebacks logged by the global handler
+TRACEBACK_LOG_INTERVAL = 0.5
+
 class ExceptionHandler:
     """
     Centralized exception handling for the application.
@@ -19,6 +26,7 @@ class ExceptionHandler:
         """Initialize the exception handler."""
         self.app = None
         self.main_window = None
+        self._last_traceback_log = float("-inf")
         
     def set_application(self, app, main_window=None):
         """
@@ -45,11 +53,16 @@ class ExceptionHandler:
             exc_value: Exception value
             exc_traceback: Exception traceback
         """
-        # Log the full exception
-        logger.critical(
-            "Unhandled exception",
-            exc_info=(exc_type, exc_value, exc_traceback)
-        )
+        # Log the full exception, but only summarize bursts of repeated failures
+        now = time.monotonic()
+        if now - self._last_traceback_log >= TRACEBACK_LOG_INTERVAL:
+            self._last_traceback_log = now
+            logger.critical(
+                "Unhandled exception",
+                exc_info=(exc_type, exc_value, exc_traceback)
+            )
+        else:
+            logger.critical("Unhandled exception: %s: %s", exc_type.__name__, exc_value)
         
         # Format error message for user
         error_msg = f"{exc_type.__name__}: {exc_value}"
@@ -95,18 +108,13 @@ class ExceptionHandler:
         Returns:
             bool: True if handled, False if re-raised
         """
-        from vipclient import VideoIPathClientError
-        from service_manager import ServiceManagerError
-        
         # Default to main window if no parent specified
         if parent is None and self.main_window:
             parent = self.main_window
         
-        # Log the error
-        logger.error(f"API error during {context}: {error}", exc_info=True)
-        
-        # Handle different error types
+        # Handle different error types; expected failures are logged without a traceback
         if isinstance(error, VideoIPathClientError):
+            logger.warning("API error during %s: %s", context, error)
             QtWidgets.QMessageBox.critical(
                 parent,
                 strings.DIALOG_TITLE_ERROR,
@@ -115,6 +123,7 @@ class ExceptionHandler:
             return True
             
         elif isinstance(error, ServiceManagerError):
+            logger.warning("API error during %s: %s", context, error)
             QtWidgets.QMessageBox.critical(
                 parent,
                 strings.DIALOG_TITLE_ERROR,
@@ -123,6 +132,7 @@ class ExceptionHandler:
             return True
             
         elif isinstance(error, requests.exceptions.RequestException):
+            logger.warning("API error during %s: %s", context, error)
             QtWidgets.QMessageBox.critical(
                 parent,
                 strings.DIALOG_TITLE_ERROR,
@@ -133,8 +143,8 @@ class ExceptionHandler:
         else:
             # Unhandled exception type, log and re-raise
             logger.error(
-                f"Unhandled exception in {context}", 
-                exc_info=True
+                "Unhandled exception in %s: %s", context, error,
+                exc_info=error
             )
             return False
     
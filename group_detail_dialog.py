@@ -2,6 +2,8 @@ import json
 from PyQt6 import QtCore
 from PyQt6 import QtWidgets
 
+RES_PLACEHOLDER = "<click to expand>"
+
 class GroupDetailDialog(QtWidgets.QDialog):
     def __init__(self, group_id: str, group_data: dict, parent=None):
         super().__init__(parent)
@@ -18,32 +20,48 @@ class GroupDetailDialog(QtWidgets.QDialog):
         self.detailsTable.setWordWrap(True)
         layout.addWidget(self.detailsTable)
 
+        # The "res" blob can be large, so it is only serialized when the user expands it
+        self._res_obj = group_data.get("res", {})
+        self.detailsTable.itemClicked.connect(self._expandRes)
+
         self._populateTable(group_id, group_data)
 
     def _populateTable(self, group_id: str, group_data: dict):
-        self.detailsTable.setRowCount(0)
+        booking = group_data.get("booking", {})
+        descriptor = booking.get("descriptor", {})
+        rows = [
+            ("Service Kind", "Group-Based Service"),
+            ("serviceId", booking.get("serviceId", group_id)),
+            ("lockedBy", booking.get("lockedBy", "")),
+            ("from", booking.get("from", "")),
+            ("to", booking.get("to", "")),
+            ("descriptor.label", descriptor.get("label", "")),
+            ("descriptor.desc", descriptor.get("desc", "")),
+            ("res", RES_PLACEHOLDER),
+        ]
 
-        def add_row(field: str, val: str):
-            r = self.detailsTable.rowCount()
-            self.detailsTable.insertRow(r)
-            item_field = QtWidgets.QTableWidgetItem(field)
-            item_field.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled)
-            self.detailsTable.setItem(r, 0, item_field)
+        # Size the table once and fill it with updates off, instead of one insertRow per field
+        self.detailsTable.setUpdatesEnabled(False)
+        try:
+            self.detailsTable.setRowCount(len(rows))
+            for r, (field, val) in enumerate(rows):
+                item_field = QtWidgets.QTableWidgetItem(field)
+                item_field.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled)
+                self.detailsTable.setItem(r, 0, item_field)
 
-            item_val = QtWidgets.QTableWidgetItem(val)
-            item_val.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable)
-            item_val.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignLeft)
-            self.detailsTable.setItem(r, 1, item_val)
+                item_val = QtWidgets.QTableWidgetItem(val)
+                item_val.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable)
+                item_val.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignLeft)
+                if field == "res":
+                    item_val.setData(QtCore.Qt.ItemDataRole.UserRole, True)  # Marks the lazy row
+                self.detailsTable.setItem(r, 1, item_val)
+        finally:
+            self.detailsTable.setUpdatesEnabled(True)
 
-        add_row("Service Kind", "Group-Based Service")
-        booking = group_data.get("booking", {})
-        add_row("serviceId", booking.get("serviceId", group_id))
-        add_row("lockedBy", booking.get("lockedBy", ""))
-        add_row("from", booking.get("from", ""))
-        add_row("to", booking.get("to", ""))
-        descriptor = booking.get("descriptor", {})
-        add_row("descriptor.label", descriptor.get("label", ""))
-        add_row("descriptor.desc", descriptor.get("desc", ""))
-        res_obj = group_data.get("res", {})
-        json_str = json.dumps(res_obj, indent=2)
-        add_row("res", json_str)
\ No newline at end of file
+    def _expandRes(self, item: QtWidgets.QTableWidgetItem):
+        """Replace the "res" placeholder with the formatted JSON on first click."""
+        if not item.data(QtCore.Qt.ItemDataRole.UserRole):
+            return
+        item.setData(QtCore.Qt.ItemDataRole.UserRole, None)
+        item.setText(json.dumps(self._res_obj, indent=2))
+        self.detailsTable.itemClicked.disconnect(self._expandRes)
@@ -1,5 +1,72 @@
 from PyQt6 import QtWidgets, QtCore
 
+class _ServicesModel(QtCore.QAbstractTableModel):
+   """
+   Read-only table of services to create, with a checkbox in column 0.
+   Check state lives in a single set of service ids rather than per-cell items.
+   """
+
+   HEADERS = ("Select", "Source", "Destination", "Profile")
+
+   def __init__(self, services, checked, parent=None):
+       """
+       services: dict of modern-format services, keyed by service id.
+       checked: set of selected service ids, updated in place as boxes are toggled.
+       """
+       super().__init__(parent)
+       self._ids = list(services)
+       self._rows = []
+       for service in services.values():
+           service_def = service.get("serviceDefinition", {})
+           self._rows.append((
+               service_def.get("fromLabel", service_def.get("from", "N/A")),
+               service_def.get("toLabel", service_def.get("to", "N/A")),
+               service_def.get("profileName", service_def.get("profileId", "N/A")),
+           ))
+       self._checked = checked
+
+   def rowCount(self, parent=QtCore.QModelIndex()):
+       return 0 if parent.isValid() else len(self._ids)
+
+   def columnCount(self, parent=QtCore.QModelIndex()):
+       return 0 if parent.isValid() else len(self.HEADERS)
+
+   def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+       column = index.column()
+       if column == 0:
+           if role == QtCore.Qt.ItemDataRole.CheckStateRole:
+               if self._ids[index.row()] in self._checked:
+                   return QtCore.Qt.CheckState.Checked
+               return QtCore.Qt.CheckState.Unchecked
+           if role == QtCore.Qt.ItemDataRole.UserRole:
+               return self._ids[index.row()]
+           return None
+       if role == QtCore.Qt.ItemDataRole.DisplayRole:
+           return self._rows[index.row()][column - 1]
+       return None
+
+   def setData(self, index, value, role=QtCore.Qt.ItemDataRole.EditRole):
+       if index.column() != 0 or role != QtCore.Qt.ItemDataRole.CheckStateRole:
+           return False
+       service_id = self._ids[index.row()]
+       if QtCore.Qt.CheckState(value) == QtCore.Qt.CheckState.Checked:
+           self._checked.add(service_id)
+       else:
+           self._checked.discard(service_id)
+       self.dataChanged.emit(index, index, [role])
+       return True
+
+   def flags(self, index):
+       if index.column() == 0:
+           return QtCore.Qt.ItemFlag.ItemIsUserCheckable | QtCore.Qt.ItemFlag.ItemIsEnabled
+       return QtCore.Qt.ItemFlag.ItemIsEnabled
+
+   def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+       if role == QtCore.Qt.ItemDataRole.DisplayRole and orientation == QtCore.Qt.Orientation.Horizontal:
+           return self.HEADERS[section]
+       return super().headerData(section, orientation, role)
+
+
 class LoadServicesDialog(QtWidgets.QDialog):
    def __init__(self, services, parent=None):
        """
@@ -12,7 +79,8 @@ class LoadServicesDialog(QtWidgets.QDialog):
        self.setWindowTitle("Confirm Service Creation")
        self.setModal(True)
        self.services = services 
-       self.selected_services = set()
+       # Every service starts selected; the model toggles membership in this set
+       self.selected_services = set(services)
 
        layout = QtWidgets.QVBoxLayout(self)
 
@@ -20,44 +88,12 @@ class LoadServicesDialog(QtWidgets.QDialog):
        info_label = QtWidgets.QLabel("Review the services below and select the ones you wish to create:")
        layout.addWidget(info_label)
 
-       # Create table with 4 columns: Select, Source, Destination, Profile
-       self.table = QtWidgets.QTableWidget(self)
-       self.table.setColumnCount(4)
-       self.table.setHorizontalHeaderLabels(["Select", "Source", "Destination", "Profile"])
-       self.table.setRowCount(len(services))
+       # Table with 4 columns: Select, Source, Destination, Profile
+       self.model = _ServicesModel(services, self.selected_services, self)
+       self.table = QtWidgets.QTableView(self)
+       self.table.setModel(self.model)
        self.table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
 
-       for row, (service_id, service) in enumerate(services.items()):
-           service_def = service.get("serviceDefinition", {})
-           source_label = service_def.get("fromLabel", service_def.get("from", "N/A"))
-           dest_label = service_def.get("toLabel", service_def.get("to", "N/A"))
-           profile_name = service_def.get("profileName", service_def.get("profileId", "N/A"))
-
-           # Column 0: Checkbox for selection
-           checkbox = QtWidgets.QCheckBox()
-           checkbox.setChecked(True)
-           checkbox.stateChanged.connect(self._update_selection)
-           self.table.setCellWidget(row, 0, checkbox)
-
-           # Column 1: Source label. Store service_id in user data
-           source_item = QtWidgets.QTableWidgetItem(source_label)
-           source_item.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled)
-           source_item.setData(QtCore.Qt.ItemDataRole.UserRole, service_id)
-           self.table.setItem(row, 1, source_item)
-
-           # Column 2: Destination label
-           dest_item = QtWidgets.QTableWidgetItem(dest_label)
-           dest_item.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled)
-           self.table.setItem(row, 2, dest_item)
-
-           # Column 3: Profile name
-           profile_item = QtWidgets.QTableWidgetItem(profile_name)
-           profile_item.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled)
-           self.table.setItem(row, 3, profile_item)
-
-           # Initially add service_id to selection
-           self.selected_services.add(service_id)
-
        self.table.horizontalHeader().setStretchLastSection(True)
        self.table.resizeColumnsToContents()
        layout.addWidget(self.table)
@@ -70,14 +106,3 @@ class LoadServicesDialog(QtWidgets.QDialog):
        self.buttonBox.accepted.connect(self.accept)
        self.buttonBox.rejected.connect(self.reject)
        layout.addWidget(self.buttonBox)
-
-   def _update_selection(self):
-       """Refresh the set of selected services based on checkbox states."""
-       self.selected_services.clear()
-       for row in range(self.table.rowCount()):
-           checkbox = self.table.cellWidget(row, 0)
-           if checkbox and checkbox.isChecked():
-               source_item = self.table.item(row, 1)
-               if source_item:
-                   service_id = source_item.data(QtCore.Qt.ItemDataRole.UserRole)
-                   self.selected_services.add(service_id)
\ No newline at end of file
@@ -3,34 +3,34 @@ logging_config.py - Centralized logging configuration for VIPrestore
 """
 
 import os
-import sys
+import atexit
+import queue
 import logging
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from constants import APP_NAME
+from utils import get_app_data_dir
 
 def configure_logging():
     """
     Configure application-wide logging with consistent levels and format.
     Creates logs in user's local appdata directory with rotation.
+    Records are handed to a background QueueListener, so logging threads never wait on disk I/O.
     
     Returns:
         str: Path to the log file
     """
-    # Cross-platform log directory determination
-    if sys.platform.startswith("win"):
-        log_dir = Path(os.getenv('LOCALAPPDATA', str(Path.home() / "AppData" / "Local"))) / APP_NAME
-    elif sys.platform == "darwin":
-        log_dir = Path.home() / "Library" / "Application Support" / APP_NAME
-    else:
-        log_dir = Path(os.getenv("XDG_CONFIG_HOME", str(Path.home() / ".config"))) / APP_NAME
-        
-    log_dir.mkdir(parents=True, exist_ok=True)
+    # Cross-platform log directory, shared with the configuration files
+    log_dir = get_app_data_dir()
     
     # Create log filename with app name
     log_filename = f"viprestore.log"
     log_path = str(log_dir / log_filename)
     
+    # The format string never uses these record fields, so skip collecting them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
     # Create root logger
     root_logger = logging.getLogger('')
     root_logger.setLevel(logging.INFO)
@@ -50,7 +50,7 @@ def configure_logging():
     )
     file_handler.setFormatter(formatter)
     file_handler.setLevel(logging.INFO)
-    root_logger.addHandler(file_handler)
+    handlers = [file_handler]
     
     # Add console handler for development environments
     if os.getenv('VIPRESTORE_DEV', '').lower() in ('1', 'true', 'yes'):
@@ -58,7 +58,14 @@ def configure_logging():
         console.setLevel(logging.DEBUG)
         console_formatter = logging.Formatter('%(name)s - %(levelname)s - %(message)s')
         console.setFormatter(console_formatter)
-        root_logger.addHandler(console)
+        handlers.append(console)
+    
+    # The root logger only enqueues; a single listener thread formats and writes
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
     
     # Configure specific loggers
     logging.getLogger('urllib3').setLevel(logging.WARNING)
@@ -1,20 +1,37 @@
 import json
+import sys
+from functools import lru_cache
 from PyQt6 import QtWidgets, uic
 from utils import resource_path
 
-class LoginDialog(QtWidgets.QDialog):
+# Frozen builds import the pyuic6-generated form (the .ui file is not bundled); running
+# from source parses login_dialog.ui once at import. Either way every LoginDialog reuses
+# the same form class
+if getattr(sys, "frozen", False):
+    from ui_login_dialog import Ui_LoginDialog
+else:
+    Ui_LoginDialog, _ = uic.loadUiType(resource_path("login_dialog.ui"))
+
+
+@lru_cache(maxsize=1)
+def _load_systems() -> tuple:
+    """Read the bundled remotesystems.json once and cache the result."""
+    try:
+        with open(resource_path("remotesystems.json"), "r") as f:
+            return tuple(json.load(f))
+    except Exception:
+        return ()
+
+
+class LoginDialog(QtWidgets.QDialog, Ui_LoginDialog):
     def __init__(self):
         super().__init__()
-        uic.loadUi(resource_path("login_dialog.ui"), self)
+        self.setupUi(self)
         self.loginButton.clicked.connect(self.accept)
         self.loadRemoteSystems()
 
     def loadRemoteSystems(self):
-        try:
-            with open(resource_path("remotesystems.json"), "r") as f:
-                systems = json.load(f)
-        except Exception:
-            systems = []
+        systems = _load_systems()
         self.comboBoxRemoteSystems.clear()
         self.remoteSystems = {}
         for system in systems:
@@ -1,79 +1,116 @@
 import sys
 import os
 import re
+import math
 import json
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used when it is absent
+    orjson = None
 import asyncio
+import atexit
+import time
+import shutil
 from datetime import datetime
-from qasync import QEventLoop
+from functools import lru_cache
+from qasync import QEventLoop, asyncSlot
 from PyQt6 import QtWidgets, uic, QtGui, QtCore
 from vipclient import VideoIPathClient, VideoIPathClientError
-from login_dialog import LoginDialog
-from load_services_dialog import LoadServicesDialog
-from group_detail_dialog import GroupDetailDialog
 from concurrent.futures import ThreadPoolExecutor
 from services_filter import ServicesFilterProxy
-from utils import resource_path, schedule_ui_task
+from utils import resource_path, schedule_ui_task, get_app_data_dir
 from service_manager import ServiceManager, ServiceManagerError
 import logging
 from pathlib import Path
 from splash_manager import SplashManager
 import styling
-from application_updater import ApplicationUpdater
-from constants import APP_NAME
+from constants import get_version
 import strings
 from logging_config import configure_logging
 from exceptions import exception_handler
 
-# This is test cmment for testing purposes
+# Handlers are installed by configure_logging() in main(); importing this module has no logging side effects
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
-# Cross-platform log directory determination
-def get_app_log_dir() -> Path:
+# Shared pool for MainWindow's own blocking client calls: doLogin's login and session
+# lookup, which run one after the other. Service fan-out uses ServiceManager's pool
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="viprestore-io")
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
+# Frozen release builds ship main.ui precompiled by pyuic6 (see viprestore.spec);
+# running from source always parses the .ui file, so edits to it take effect
+if getattr(sys, "frozen", False):
+    from ui_main import Ui_MainWindow
+else:
+    Ui_MainWindow, _ = uic.loadUiType(resource_path("main.ui"))
+
+# Reused for every config save when orjson is unavailable; matches orjson's raw UTF-8 output
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+_LABEL_RE = re.compile(r'(.+?)\s*->\s*(.+)')
+
+def _split_label(label: str) -> tuple[str, str]:
     """
-    Returns a Path object for a user-writable application log directory.
-    On Windows, uses LOCALAPPDATA; on macOS, uses Application Support; on Linux, uses XDG_CONFIG_HOME.
-    The directory is created if it doesn't exist.
+    Split a "source -> destination" service label into its two parts.
+    Labels without an arrow are returned as (label, "").
     """
-    if sys.platform.startswith("win"):
-        log_dir = Path(os.getenv("LOCALAPPDATA", str(Path.home() / "AppData" / "Local"))) / APP_NAME
-    elif sys.platform == "darwin":
-        log_dir = Path.home() / "Library" / "Application Support" / APP_NAME
-    else:
-        log_dir = Path(os.getenv("XDG_CONFIG_HOME", Path.home() / ".config")) / APP_NAME
-    
-    log_dir.mkdir(parents=True, exist_ok=True)
-    return log_dir
-
-# Use the cross-platform function for log directory
-log_dir = get_app_log_dir()
-timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-log_filename = f"viprestore_{timestamp}.log"
-
-# Configure logging
-logging.basicConfig(
-    filename=str(log_dir / log_filename),
-    filemode='w',  # 'w' instead of 'a' since each file is new
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    level=logging.INFO
-)
-logging.debug("Application started")
+    # Fast path for the usual " -> " separator, taken only when it holds the first
+    # "->" so the result is identical to the regex
+    head, sep, tail = label.partition(" -> ")
+    if sep and head and "->" not in head and not head.endswith("-"):
+        return head.strip(), tail.strip()
+    match = _LABEL_RE.match(label)
+    if match:
+        return match.group(1).strip(), match.group(2).strip()
+    return label, ""
+
+def _as_timestamp(value):
+    """
+    Convert a booking start value to an int timestamp, or None if it is empty or malformed.
+    Checks types up front so malformed values never go through int()'s exception path.
+    """
+    if type(value) is int:  # The API's usual form; also excludes bools
+        return value or None
+    if isinstance(value, str):
+        text = value.strip()
+        digits = text[1:] if text[:1] in "+-" else text
+        return int(text) if digits.isascii() and digits.isdigit() else None
+    if isinstance(value, float) and math.isfinite(value):
+        return int(value) or None
+    return None
+
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+_START_FMT = "%d-%m-%Y - %H:%M:%S"
+
+@lru_cache(maxsize=4096)
+def _format_epoch_ms(timestamp_ms: int) -> str:
+    """Format a millisecond epoch timestamp; services often share start times, so results are cached."""
+    return datetime.fromtimestamp(timestamp_ms / 1000).strftime(_TS_FMT)
+
+@lru_cache(maxsize=65536)
+def _format_start_ms(timestamp_ms: int) -> str:
+    """Format a booking start time for the services table; cached across refreshes."""
+    return datetime.fromtimestamp(timestamp_ms / 1000).strftime(_START_FMT)
+
+@lru_cache(maxsize=1)
+def _about_dialog_form():
+    """Return the About dialog form class, resolved on first use instead of on every open."""
+    # Frozen builds ship only the pyuic6-generated form; the .ui file is read from source
+    if getattr(sys, "frozen", False):
+        from ui_about_dialog import Ui_AboutDialog
+        return Ui_AboutDialog
+    form_class, _ = uic.loadUiType(resource_path("about_dialog.ui"))
+    return form_class
 
 def get_user_config_dir() -> Path:
     """
     Returns a Path object for a user-writable configuration directory.
-    On Windows, uses LOCALAPPDATA; on macOS, uses Application Support; on Linux, uses XDG_CONFIG_HOME (or ~/.config).
-    The directory is created if it doesn't exist.
+    This is the shared per-user application directory; see utils.get_app_data_dir.
     """
-    if sys.platform.startswith("win"):
-        config_dir = Path(os.getenv("LOCALAPPDATA", str(Path.home() / "AppData" / "Local"))) / "VIPrestore"
-    elif sys.platform == "darwin":
-        config_dir = Path.home() / "Library" / "Application Support" / "VIPrestore"
-    else:
-        config_dir = Path(os.getenv("XDG_CONFIG_HOME", Path.home() / ".config")) / "VIPrestore"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir
+    return get_app_data_dir()
 
+@lru_cache(maxsize=1)
 def get_remote_systems_config_file() -> Path:
     """
     Returns the full path to remotesystems.json in the user-writable config directory.
@@ -86,11 +123,16 @@ def save_remote_systems_config(config_data: dict) -> None:
     """
     config_file = get_remote_systems_config_file()
     try:
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(config_data, f, indent=2)
-        logging.debug(f"Remote systems configuration saved to {config_file}")
+        if orjson is not None:
+            with open(config_file, "wb") as f:
+                f.write(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(config_file, "w", encoding="utf-8") as f:
+                for chunk in _JSON_ENCODER.iterencode(config_data):
+                    f.write(chunk)
+        logger.debug("Remote systems configuration saved to %s", config_file)
     except Exception as e:
-        logging.error(f"Error saving remote systems configuration: {e}")
+        logger.error("Error saving remote systems configuration: %s", e)
         raise
 
 def load_remote_systems_config() -> dict | None:
@@ -100,15 +142,19 @@ def load_remote_systems_config() -> dict | None:
     """
     config_file = get_remote_systems_config_file()
     if not config_file.exists():
-        logging.debug(f"Remote systems configuration file does not exist at {config_file}")
+        logger.debug("Remote systems configuration file does not exist at %s", config_file)
         return None
     try:
-        with open(config_file, "r", encoding="utf-8") as f:
-            config_data = json.load(f)
-        logging.debug(f"Remote systems configuration loaded from {config_file}")
+        if orjson is not None:
+            with open(config_file, "rb") as f:
+                config_data = orjson.loads(f.read())
+        else:
+            with open(config_file, "r", encoding="utf-8") as f:
+                config_data = json.load(f)
+        logger.debug("Remote systems configuration loaded from %s", config_file)
         return config_data
     except Exception as e:
-        logging.error(f"Error loading remote systems configuration: {e}")
+        logger.error("Error loading remote systems configuration: %s", e)
         return None
 
 def ensure_remote_systems_config():
@@ -118,28 +164,77 @@ def ensure_remote_systems_config():
     """
     config_file = get_remote_systems_config_file()
     if not config_file.exists():
-        default_config_path = resource_path("remotesystems.json")
-        if os.path.exists(default_config_path):
+        default_config_path = Path(resource_path("remotesystems.json"))
+        if default_config_path.is_file():
             try:
-                with open(default_config_path, "r", encoding="utf-8") as src, \
-                     open(config_file, "w", encoding="utf-8") as dst:
-                    dst.write(src.read())
-                logging.debug(f"Copied default remotesystems.json to {config_file}")
+                # Byte-for-byte copy; lets the OS use its fast copy path where available
+                shutil.copyfile(default_config_path, config_file)
+                logger.debug("Copied default remotesystems.json to %s", config_file)
             except Exception as e:
-                logging.error(f"Failed to copy default remotesystems.json: {e}")
+                logger.error("Failed to copy default remotesystems.json: %s", e)
         else:
-            logging.debug("Default remotesystems.json not found in resources.")
+            logger.debug("Default remotesystems.json not found in resources.")
+
+class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
+    _SPINNER_PATH = resource_path(os.path.join("logos", "spinner.gif"))
+
+    # Seconds between session checks, and the minimum age of the last successful
+    # check before refocusing the window checks again
+    _SESSION_CHECK_INTERVAL = 30
+
+    # User input that counts as activity for session polling
+    _ACTIVITY_EVENTS = frozenset((
+        QtCore.QEvent.Type.MouseButtonPress,
+        QtCore.QEvent.Type.KeyPress,
+    ))
+
+    # Connection indicator colour and text for HTTPS, keyed by whether the certificate verified
+    _HTTPS_STATUS = {
+        True: ("green", "Connected (HTTPS, valid SSL)"),
+        False: ("orange", "Connected (HTTPS, invalid SSL)"),
+    }
+
+    # Menu actions as (menu, entries); each entry is
+    # (attribute, label, shortcut, handler method), or None for a separator
+    _ACTION_SPEC = (
+        ("menuFile", (
+            ("actionLogin", "Login", "Ctrl+L", "doLogin"),
+            ("actionLogout", "Logout", "Ctrl+Shift+L", "doLogout"),
+            None,
+            ("actionLoadServices", "Load Services", "Ctrl+O", "load_and_create_services"),
+            ("actionSaveSelectedServices", "Save Selected Services", "Ctrl+S", "saveSelectedServices"),
+            None,
+            ("actionExit", "Exit", "Ctrl+Q", "close"),
+        )),
+        ("menuTools", (
+            ("actionCancelSelectedServices", "Cancel Selected Services", "Ctrl+D", "cancelSelectedServices"),
+            ("actionRefresh", "Refresh Services", "F5", "refreshServicesAsync"),
+            None,
+            ("actionEditSystems", "Edit Systems", "Ctrl+E", "editSystems"),
+        )),
+        ("menuHelp", (
+            ("actionAbout", "About", "F1", "showAbout"),
+            None,
+            ("actionHelp", "User Manual", "Ctrl+H", "showHelpManual"),
+        )),
+    )
 
-class MainWindow(QtWidgets.QMainWindow):
     def __init__(self):
         super().__init__()
-        uic.loadUi(resource_path("main.ui"), self)
+        self.setupUi(self)
 
         # Add this right after super().__init__()
         self.bold_font_family = None  # Will be set from main()
+        self._bold_font = None
+        self._manual_html = None  # Rendered user manual, cached on first open
+        self._about_pixmap = None  # Scaled About-dialog logo, cached on first open
         
         # Initialize current services storage
         self.currentServices = {}
+        # URL scheme of the server, parsed once at login; None until a server is chosen
+        self._server_scheme = None
+        # In-flight refresh, cancelled when a newer one starts
+        self._refreshTask = None
 
         # Clean up menu bar: create a new organized menu bar for improved UX
         menubar = self.menuBar()
@@ -149,71 +244,20 @@ class MainWindow(QtWidgets.QMainWindow):
         self.menuTools = menubar.addMenu("Tools")
         self.menuHelp = menubar.addMenu("Help")
 
-        # Create actions with keyboard shortcuts
-        self.actionLogin = QtGui.QAction("Login", self)
-        self.actionLogin.setShortcut("Ctrl+L")
-
-        self.actionLogout = QtGui.QAction("Logout", self)
-        self.actionLogout.setShortcut("Ctrl+Shift+L")
-
-        self.actionLoadServices = QtGui.QAction("Load Services", self)
-        self.actionLoadServices.setShortcut("Ctrl+O")
-
-        self.actionSaveSelectedServices = QtGui.QAction("Save Selected Services", self)
-        self.actionSaveSelectedServices.setShortcut("Ctrl+S")
-
-        self.actionExit = QtGui.QAction("Exit", self)
-        self.actionExit.setShortcut("Ctrl+Q")
-
-        self.actionRefresh = QtGui.QAction("Refresh Services", self)
-        self.actionRefresh.setShortcut("F5")
-
-        self.actionEditSystems = QtGui.QAction("Edit Systems", self)
-        self.actionEditSystems.setShortcut("Ctrl+E")
-
-        self.actionAbout = QtGui.QAction("About", self)
-        self.actionAbout.setShortcut("F1")
-
-        # --- Cancel Services Action ---
-        self.actionCancelSelectedServices = QtGui.QAction("Cancel Selected Services", self)
-        self.actionCancelSelectedServices.setShortcut("Ctrl+D")
+        # Create actions with keyboard shortcuts, in menu order
+        for menu_name, entries in self._ACTION_SPEC:
+            menu = getattr(self, menu_name)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                attr, label, shortcut, handler = entry
+                action = QtGui.QAction(label, self)
+                action.setShortcut(shortcut)
+                setattr(self, attr, action)
+                menu.addAction(action)
+                action.triggered.connect(getattr(self, handler))
         self.actionCancelSelectedServices.setEnabled(False)
-        self.menuTools.addAction(self.actionCancelSelectedServices)
-        self.actionCancelSelectedServices.triggered.connect(lambda: asyncio.create_task(self.cancelSelectedServices()))
-        # --- End Cancel Services Action ---
-
-        # Add actions to File menu with grouping separators
-        self.menuFile.addAction(self.actionLogin)
-        self.menuFile.addAction(self.actionLogout)
-        self.menuFile.addSeparator()
-        self.menuFile.addAction(self.actionLoadServices)
-        self.menuFile.addAction(self.actionSaveSelectedServices)
-        self.menuFile.addSeparator()
-        self.menuFile.addAction(self.actionExit)
-
-        # Add actions to Tools menu (with a separator between groups)
-        self.menuTools.addAction(self.actionRefresh)
-        self.menuTools.addSeparator()
-        self.menuTools.addAction(self.actionEditSystems)
-
-        # Add actions to Help menu with a separator
-        self.menuHelp.addAction(self.actionAbout)
-        self.menuHelp.addSeparator()
-
-        self.actionHelp = QtGui.QAction("User Manual", self)
-        self.actionHelp.setShortcut("Ctrl+H")
-        self.menuHelp.addAction(self.actionHelp)
-        self.actionHelp.triggered.connect(self.showHelpManual)
-
-        # Connect Action Signals
-        self.actionLogin.triggered.connect(lambda: asyncio.create_task(self.doLogin()))
-        self.actionLogout.triggered.connect(self.doLogout)
-        self.actionLoadServices.triggered.connect(lambda: asyncio.create_task(self.load_and_create_services()))
-        self.actionSaveSelectedServices.triggered.connect(lambda: asyncio.create_task(self.saveSelectedServices()))
-        self.actionExit.triggered.connect(self.close)
-        self.actionRefresh.triggered.connect(lambda: asyncio.create_task(self.refreshServicesAsync()))
-        self.actionEditSystems.triggered.connect(self.editSystems)
-        self.actionAbout.triggered.connect(self.showAbout)
 
         self.setSplitterPlacement()
 
@@ -223,7 +267,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.profileCheckBoxes = []
 
         # Executor for blocking calls
-        self.executor = ThreadPoolExecutor()
+        self.executor = _EXECUTOR
 
         # Basic table configuration - don't create models yet
         self.tableViewServices.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
@@ -233,8 +277,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tableViewServices.setSortingEnabled(True)
         self.tableViewServices.clicked.connect(self.onServiceClicked)
 
-        # Setup Model and Filter for Services
+        # Setup Model and Filter for Services. Built exactly once: the filter widgets
+        # below fire their change handlers during __init__ and need the proxy in place
         self.serviceModel = QtGui.QStandardItemModel(self)
+        # Service ID -> row in serviceModel, so a selection can be re-found without a scan
+        self._idToSourceRow = {}
         self.filterProxy = ServicesFilterProxy(self)
         self.filterProxy.setSourceModel(self.serviceModel)
         self.tableViewServices.setModel(self.filterProxy)
@@ -248,6 +295,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.checkBoxEnableTimeFilter.stateChanged.connect(self.onTimeFilterChanged)
         self.buttonResetFilters.clicked.connect(self.onResetFilters)
 
+        # Coalesce bursts of keystrokes in the text filters into a single filter pass
+        self._filterTimer = QtCore.QTimer(self)
+        self._filterTimer.setSingleShot(True)
+        self._filterTimer.setInterval(150)
+        self._filterTimer.timeout.connect(self._applyTextFilters)
+
         # Configure Profile Filters Area
         self.scrollAreaProfilesFilters.setWidgetResizable(True)
         self.layoutProfiles = self.verticalLayoutProfilesList
@@ -279,10 +332,18 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tableWidgetServiceDetails.setAlternatingRowColors(True)
 
         # Setup Session Timer
+        # Session checks only run while logged in, while the app is in the foreground and
+        # when the user has done something since the last successful check
         self.sessionTimer = QtCore.QTimer(self)
-        self.sessionTimer.setInterval(30000)
-        self.sessionTimer.timeout.connect(self.checkSession)
-        self.sessionTimer.start()
+        self.sessionTimer.setInterval(self._SESSION_CHECK_INTERVAL * 1000)
+        self.sessionTimer.timeout.connect(self._onSessionTimer)
+        self._sessionConnected = False
+        self._sessionCheckRunning = False
+        self._lastSessionCheck = float("-inf")  # time.monotonic() of the last successful check
+        self._lastActivity = 0.0  # time.monotonic() of the last mouse press or key press
+        app = QtWidgets.QApplication.instance()
+        app.applicationStateChanged.connect(self._onApplicationStateChanged)
+        app.installEventFilter(self)
 
         # --- Context Menu Setup ---
         self.tableViewServices.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
@@ -299,7 +360,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self.frameConnectionIndicator.setMaximumSize(QtCore.QSize(20, 20))
         self.frameConnectionIndicator.setFrameShape(QtWidgets.QFrame.Shape.Box)
         self.frameConnectionIndicator.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.frameConnectionIndicator.setStyleSheet("background-color: grey;")
+        # The indicator is coloured through its palette; a per-state stylesheet would be
+        # re-parsed and re-polished on every connection change
+        self.frameConnectionIndicator.setAutoFillBackground(True)
+        self._indicatorPalettes = {}
+        self._setIndicatorColor("grey")
         status_bar.addWidget(self.frameConnectionIndicator)
 
         self.labelConnectionStatusText = QtWidgets.QLabel("No Connection")
@@ -316,8 +381,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Loading spinner (force a fixed size to prevent expansion)
         self.loadingLabel = QtWidgets.QLabel("")
-        self.loadingMovie = QtGui.QMovie(resource_path(os.path.join("logos", "spinner.gif")))
-        self.loadingLabel.setMovie(self.loadingMovie)
+        # The GIF is only decoded the first time the spinner is shown
+        self.loadingMovie = None
         self.loadingLabel.setFixedSize(20, 20)  # <-- Fixed size to constrain height
         status_bar.addWidget(self.loadingLabel)
         self.loadingLabel.setVisible(False)
@@ -340,8 +405,6 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tableWidgetServiceDetails.customContextMenuRequested.connect(self.showDetailsContextMenu)
         # --- End Context Menu for Details Table ---
 
-        schedule_ui_task(self.initialize_table_models, 100)
-
     def showHelpManual(self):
         help_dialog = QtWidgets.QDialog(self)
         help_dialog.setWindowTitle("VIPrestore - User Manual")
@@ -353,14 +416,18 @@ class MainWindow(QtWidgets.QMainWindow):
         text_browser = QtWidgets.QTextBrowser(help_dialog)
         text_browser.setOpenExternalLinks(True)
         
-        # Load the manual content
-        manual_path = resource_path("manual.md")
-        try:
-            with open(manual_path, "r", encoding="utf-8") as f:
-                manual_content = f.read()
-            text_browser.setMarkdown(manual_content)
-        except Exception as e:
-            text_browser.setPlainText(f"Error loading manual: {str(e)}")
+        # Load the manual content; markdown is parsed once, later opens reuse the HTML
+        if self._manual_html is not None:
+            text_browser.setHtml(self._manual_html)
+        else:
+            manual_path = resource_path("manual.md")
+            try:
+                with open(manual_path, "r", encoding="utf-8") as f:
+                    manual_content = f.read()
+                text_browser.setMarkdown(manual_content)
+                self._manual_html = text_browser.toHtml()
+            except Exception as e:
+                text_browser.setPlainText(f"Error loading manual: {str(e)}")
         
         layout.addWidget(text_browser)
         
@@ -377,7 +444,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Create a "Save Selected" action for the context menu
         save_action = QtGui.QAction("Save Selected Services", self)
-        save_action.triggered.connect(lambda: asyncio.create_task(self.saveSelectedServices()))
+        save_action.triggered.connect(self.saveSelectedServices)
         context_menu.addAction(save_action)
 
         # --- Copy Cell Action ---
@@ -420,55 +487,36 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def ssl_exception_handler(self, message: str) -> bool:
         """Handle SSL certificate exceptions by prompting the user in a thread-safe way"""
-        # We need to use Qt's event loop to call back to the main thread
-        event_loop = QtCore.QEventLoop()
-        result = [False]  # Use a list to store the result from the inner function
-        
-        # This will run on the main thread
-        def show_dialog():
-            reply = QtWidgets.QMessageBox.question(
-                self,
-                "SSL Certificate Warning",
-                message,
-                QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No,
-                QtWidgets.QMessageBox.StandardButton.No  # Default is No (safer)
-            )
-            result[0] = reply == QtWidgets.QMessageBox.StandardButton.Yes
-            event_loop.quit()
-        
-        # Schedule the dialog to be shown on the main thread
-        QtCore.QMetaObject.invokeMethod(self, "showSslWarningDialog", 
-                                    QtCore.Qt.ConnectionType.QueuedConnection,
-                                    QtCore.Q_ARG(str, message),
-                                    QtCore.Q_ARG(object, result),
-                                    QtCore.Q_ARG(object, event_loop))
-        
-        # Wait for the dialog to be handled
-        event_loop.exec()
-        return result[0]
+        if QtCore.QThread.currentThread() == self.thread():
+            return self._sslWarningDialog(message)
+        # Called from an executor thread: block it until the GUI thread has an answer
+        return QtCore.QMetaObject.invokeMethod(
+            self,
+            "_sslWarningDialog",
+            QtCore.Qt.ConnectionType.BlockingQueuedConnection,
+            QtCore.Q_RETURN_ARG(bool),
+            QtCore.Q_ARG(str, message)
+        )
 
-    # Add this slot method to MainWindow
-    @QtCore.pyqtSlot(str, object, object)
-    def showSslWarningDialog(self, message, result_list, event_loop):
+    @QtCore.pyqtSlot(str, result=bool)
+    def _sslWarningDialog(self, message):
         """Slot to show SSL warning dialog on the main thread"""
         reply = QtWidgets.QMessageBox.question(
             self,
             "SSL Certificate Warning",
             message,
             QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No,
-            QtWidgets.QMessageBox.StandardButton.No
+            QtWidgets.QMessageBox.StandardButton.No  # Default is No (safer)
         )
-        result_list[0] = reply == QtWidgets.QMessageBox.StandardButton.Yes
-        event_loop.quit()
+        return reply == QtWidgets.QMessageBox.StandardButton.Yes
 
     def _format_timestamp(self, timestamp):
         """Converts a timestamp into a readable date format."""
         if not timestamp:
             return "N/A"
         try:
-            dt_val = datetime.fromtimestamp(int(timestamp) / 1000)
-            return dt_val.strftime("%Y-%m-%d %H:%M:%S")
-        except Exception:
+            return _format_epoch_ms(int(timestamp))
+        except (TypeError, ValueError, OverflowError, OSError):
             return str(timestamp)
 
     def copyCell(self, table_widget):
@@ -490,6 +538,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 text = table_widget.model().data(index, QtCore.Qt.ItemDataRole.DisplayRole)
                 QtWidgets.QApplication.clipboard().setText(str(text))
 
+    @asyncSlot()
     async def cancelSelectedServices(self):
         indexes = self.tableViewServices.selectionModel().selectedRows()
         if not indexes:
@@ -511,10 +560,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if confirm != QtWidgets.QMessageBox.StandardButton.Yes:
             return
 
-        service_ids = []
-        for index in indexes:
-            service_id = self.filterProxy.index(index.row(), 0).data()
-            service_ids.append(service_id)
+        service_ids = self._selectedServiceIds(indexes)
 
         try:
             result = await self.service_manager.cancel_services(service_ids)
@@ -543,58 +589,35 @@ class MainWindow(QtWidgets.QMainWindow):
         When the main window is about to close, stop the sessionTimer
         so it doesn't keep calling checkSession() on a destroyed window.
         """
+        self._sessionConnected = False
         if self.sessionTimer.isActive():
             self.sessionTimer.stop()
+        self.service_manager.shutdown()
         super().closeEvent(event)
 
+    def _selectedServiceIds(self, indexes):
+        """Return the service ids for selected proxy rows, read straight from the source items."""
+        map_to_source = self.filterProxy.mapToSource
+        source_item = self.serviceModel.item
+        return [source_item(map_to_source(index).row(), 0).text() for index in indexes]
+
     def update_table_fonts(self):
         """Update table fonts explicitly"""
-        if self.bold_font_family:
-            print(f"Updating table fonts to: {self.bold_font_family}")  # Debug print
-            bold_font = QtGui.QFont(self.bold_font_family, 10, QtGui.QFont.Weight.Bold)
-            self.tableViewServices.setFont(bold_font)
-            self.tableWidgetServiceDetails.setFont(bold_font)
-
-    def initialize_table_models(self):
-        """Lazily initialize table models and related data structures.
-        Called after the window is visible to improve startup time."""
-        
-        # Configure Service View Table - deferred initialization
-        self.serviceModel = QtGui.QStandardItemModel(self)
-        self.filterProxy = ServicesFilterProxy(self)
-        self.filterProxy.setSourceModel(self.serviceModel)
-        self.tableViewServices.setModel(self.filterProxy)
-        self.tableViewServices.selectionModel().selectionChanged.connect(self.onServiceSelectionChanged)
-        
-        # Log completion
-        logger.debug("Table models initialized")
+        if self._bold_font is not None:
+            self.tableViewServices.setFont(self._bold_font)
+            self.tableWidgetServiceDetails.setFont(self._bold_font)
 
     def set_bold_font_family(self, font_family):
-        print(f"Setting bold font family to: {font_family}")
+        """
+        Record the bold table font. The table stylesheet and fonts are then applied once by
+        styling.AppearanceManager.setup_complete (apply_table_styles and update_table_fonts),
+        which runs right after this during startup.
+        """
+        if font_family == self.bold_font_family:
+            return
+        logger.debug("Setting bold font family to: %s", font_family)
         self.bold_font_family = font_family
-        if self.bold_font_family:
-            table_style = f"""
-                QTableView, QTableWidget {{
-                    background-color: #eeeeee;
-                    alternate-background-color: #dddddd;
-                    color: black;
-                    font-family: "{self.bold_font_family}";
-                    font-weight: bold;
-                }}
-                QTableView::item:selected, QTableWidget::item:selected {{
-                    background-color: #a1aaff;
-                    color: black;
-                }}
-            """
-            print("Applying table style with bold font")
-            # Remove this line to avoid affecting the entire window:
-            # self.setStyleSheet(table_style)
-            self.tableWidgetServiceDetails.setStyleSheet(table_style)
-            self.tableViewServices.setStyleSheet(table_style)
-            
-            # Force update of table fonts
-            self.tableViewServices.setFont(QtGui.QFont(self.bold_font_family, 10, QtGui.QFont.Weight.Bold))
-            self.tableWidgetServiceDetails.setFont(QtGui.QFont(self.bold_font_family, 10, QtGui.QFont.Weight.Bold))
+        self._bold_font = QtGui.QFont(font_family, 10, QtGui.QFont.Weight.Bold) if font_family else None
 
     def setSplitterPlacement(self):
         splitter = self.findChild(QtWidgets.QSplitter, "splitterCentral")
@@ -603,23 +626,33 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         splitter.setSizes([400, 340])
 
+    @asyncSlot()
     async def doLogin(self):
+        # Dialog modules are imported on first use to keep them off the startup path
+        from login_dialog import LoginDialog
+        client = None
         while True:
             dlg = LoginDialog()
             if dlg.exec() != QtWidgets.QDialog.DialogCode.Accepted:
                 break
             server_url, username, password = dlg.getCredentials()
             self.server_url = server_url  # Store for later reference
-            self.client = VideoIPathClient(
-                server_url,
-                verify_ssl=True,
-                ssl_exception_callback=self.ssl_exception_handler  # Add this parameter
-            )
+            scheme, sep, _ = server_url.partition("://")
+            self._server_scheme = scheme.lower() if sep else ""
+            # Retrying against the same server reuses the previous attempt's client: its pooled,
+            # already-verified TLS connection and any certificate exception the user accepted
+            if client is None or client.base_url != server_url.rstrip("/"):
+                client = VideoIPathClient(
+                    server_url,
+                    verify_ssl=True,
+                    ssl_exception_callback=self.ssl_exception_handler  # Add this parameter
+                )
+            self.client = client
             loop = asyncio.get_running_loop()
             try:
                 await loop.run_in_executor(self.executor, self.client.login, username, password)
                 self.service_manager.set_client(self.client)
-                session_info = await loop.run_in_executor(self.executor, lambda: self.client.get("/api/_session"))
+                session_info = await loop.run_in_executor(self.executor, self.client.get, "/api/_session")
                 user_data = session_info.get("userCtx", {})
                 username_disp = user_data.get("name", "unknown")
                 roles = user_data.get("roles", [])
@@ -640,7 +673,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 continue
 
             # Determine SSL verification status based on client settings.
-            ssl_verified = self.client.session.verify if server_url.startswith("https://") else False
+            ssl_verified = self.client.session.verify if self._server_scheme == "https" else False
             self.updateConnectionStatus(True, ssl_verified)
             await self.refreshServicesAsync()
             break
@@ -660,8 +693,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.clearAppState()
 
     def clearAppState(self):
-        # Clear service table and details
-        self.serviceModel.clear()
+        # Clear service table and details; setRowCount keeps the columns and headers,
+        # so the next login's refresh fills the same model rather than rebuilding it
+        self.serviceModel.setRowCount(0)
+        self._idToSourceRow = {}
         self.tableWidgetServiceDetails.setRowCount(0)
         self.tableViewServices.clearSelection()
         self.currentServices.clear()
@@ -682,6 +717,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 w.deleteLater()
         self.profileCheckBoxes.clear()
 
+    @asyncSlot()
     async def saveSelectedServices(self):
         indexes = self.tableViewServices.selectionModel().selectedRows()
         if not indexes:
@@ -692,10 +728,7 @@ class MainWindow(QtWidgets.QMainWindow):
             )
             return
 
-        service_ids = []
-        for index in indexes:
-            service_id = self.filterProxy.index(index.row(), 0).data()
-            service_ids.append(service_id)
+        service_ids = self._selectedServiceIds(indexes)
 
         try:
             modern_services_to_save = self.service_manager.prepare_services_for_export(service_ids)
@@ -710,7 +743,12 @@ class MainWindow(QtWidgets.QMainWindow):
             if not file_path:
                 return
 
-            await self.service_manager.save_services(modern_services_to_save, file_path)
+            # The write runs on the executor, so the spinner keeps animating meanwhile
+            self.startLoadingAnimation()
+            try:
+                await self.service_manager.save_services(modern_services_to_save, file_path)
+            finally:
+                self.stopLoadingAnimation()
             
             QtWidgets.QMessageBox.information(
                 self,
@@ -741,16 +779,23 @@ class MainWindow(QtWidgets.QMainWindow):
         if not file_path:
             return None
 
+        # The read and parse run on the executor, so the spinner keeps animating meanwhile
+        self.startLoadingAnimation()
         try:
             return await self.service_manager.load_services(file_path)
         except ServiceManagerError as e:
+            # Stop first so the spinner isn't animating behind the modal error dialog
+            self.stopLoadingAnimation()
             QtWidgets.QMessageBox.critical(
                 self,
                 "Error Loading File",
                 str(e)
             )
             return None
+        finally:
+            self.stopLoadingAnimation()
 
+    @asyncSlot()
     async def load_and_create_services(self):
         """
         Loads modern-format services from a file, presents them in a confirmation dialog,
@@ -760,6 +805,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if not services:
             return
 
+        from load_services_dialog import LoadServicesDialog
         dlg = LoadServicesDialog(services, self)
         if dlg.exec() != QtWidgets.QDialog.DialogCode.Accepted:
             return
@@ -819,28 +865,30 @@ class MainWindow(QtWidgets.QMainWindow):
         dlg = SystemsEditorDialog(self, config_dir=config_dir)
         dlg.exec()
 
+    def _setIndicatorColor(self, color: str):
+        """Fill the connection indicator with a named colour, building each palette once."""
+        palette = self._indicatorPalettes.get(color)
+        if palette is None:
+            palette = QtGui.QPalette(self.frameConnectionIndicator.palette())
+            palette.setColor(QtGui.QPalette.ColorRole.Window, QtGui.QColor(color))
+            self._indicatorPalettes[color] = palette
+        self.frameConnectionIndicator.setPalette(palette)
+
     def updateConnectionStatus(self, connected: bool, ssl_verified: bool = True):
         if connected:
-            if hasattr(self, 'server_url'):
-                if self.server_url.startswith("https://"):
-                    if ssl_verified:
-                        self.frameConnectionIndicator.setStyleSheet("background-color: green;")
-                        self.labelConnectionStatusText.setText("Connected (HTTPS, valid SSL)")
-                    else:
-                        self.frameConnectionIndicator.setStyleSheet("background-color: orange;")
-                        self.labelConnectionStatusText.setText("Connected (HTTPS, invalid SSL)")
-                elif self.server_url.startswith("http://"):
-                    self.frameConnectionIndicator.setStyleSheet("background-color: red;")
-                    self.labelConnectionStatusText.setText("Connected (HTTP, not secure)")
-                else: # Added this for completeness
-                    self.frameConnectionIndicator.setStyleSheet("background-color: green;")
-                    self.labelConnectionStatusText.setText("Connected (Unknown Protocol)")
-            else:  # Handle case where server_url is not set, but connected is True
-                self.frameConnectionIndicator.setStyleSheet("background-color: yellow;")  # Distinct color
-                self.labelConnectionStatusText.setText("Connected (Server URL not set)")
+            scheme = self._server_scheme
+            if scheme is None:  # Handle case where server_url is not set, but connected is True
+                color, text = "yellow", "Connected (Server URL not set)"  # Distinct color
+            elif scheme == "https":
+                color, text = self._HTTPS_STATUS[bool(ssl_verified)]
+            elif scheme == "http":
+                color, text = "red", "Connected (HTTP, not secure)"
+            else:
+                color, text = "green", "Connected (Unknown Protocol)"
         else:
-            self.frameConnectionIndicator.setStyleSheet("background-color: grey;")
-            self.labelConnectionStatusText.setText("No Connection")
+            color, text = "grey", "No Connection"
+        self._setIndicatorColor(color)
+        self.labelConnectionStatusText.setText(text)
         
         self.actionLogout.setEnabled(connected)
         self.actionSaveSelectedServices.setEnabled(connected)
@@ -853,21 +901,54 @@ class MainWindow(QtWidgets.QMainWindow):
         # Always hide spinner when not loading.
         self.loadingLabel.setVisible(False)
 
+        self._sessionConnected = connected
+        # Logging in has just validated the session; the next check can wait a full interval
+        self._lastSessionCheck = time.monotonic() if connected else float("-inf")
+        self._updateSessionPolling()
+
+    def _updateSessionPolling(self):
+        app_active = QtGui.QGuiApplication.applicationState() == QtCore.Qt.ApplicationState.ApplicationActive
+        if self._sessionConnected and app_active:
+            if not self.sessionTimer.isActive():
+                self.sessionTimer.start()
+        else:
+            self.sessionTimer.stop()
+
+    def _onApplicationStateChanged(self, state):
+        # Returning to the app checks right away unless a check succeeded recently
+        if (state == QtCore.Qt.ApplicationState.ApplicationActive and self._sessionConnected
+                and time.monotonic() - self._lastSessionCheck >= self._SESSION_CHECK_INTERVAL):
+            self.checkSession()
+        self._updateSessionPolling()
+
+    def _onSessionTimer(self):
+        # An idle session is not re-checked; the next interaction or refocus catches expiry
+        if self._lastActivity > self._lastSessionCheck:
+            self.checkSession()
+
+    def eventFilter(self, obj, event):
+        if event.type() in self._ACTIVITY_EVENTS:
+            self._lastActivity = time.monotonic()
+        return super().eventFilter(obj, event)
+
 
     def showAbout(self):
         """Shows the About dialog with application information."""
         version = get_version()
 
         dlg = QtWidgets.QDialog()
-        uic.loadUi(resource_path("about_dialog.ui"), dlg)
+        _about_dialog_form()().setupUi(dlg)
 
         # Set window title & fixed size for a polished look
         dlg.setWindowTitle(strings.DIALOG_TITLE_ABOUT)
         dlg.setFixedSize(400, 300)  # Adjust to fit contents
 
-        # Load the application icon
-        icon_path = resource_path("logos/viprestore_icon.png")
-        pixmap = QtGui.QPixmap(icon_path).scaled(100, 100, QtCore.Qt.AspectRatioMode.KeepAspectRatio, QtCore.Qt.TransformationMode.SmoothTransformation)
+        # Load and scale the application icon once; later dialogs reuse it
+        pixmap = self._about_pixmap
+        if pixmap is None:
+            icon_path = resource_path("logos/viprestore_icon.png")
+            pixmap = QtGui.QPixmap(icon_path).scaled(100, 100, QtCore.Qt.AspectRatioMode.KeepAspectRatio, QtCore.Qt.TransformationMode.SmoothTransformation)
+            self._about_pixmap = pixmap
 
         # Update QLabel for the logo
         logo_label = dlg.findChild(QtWidgets.QLabel, "labelLogo")
@@ -876,7 +957,6 @@ class MainWindow(QtWidgets.QMainWindow):
             logo_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
 
         # Update version information
-        version = get_version()
         label = dlg.findChild(QtWidgets.QLabel, "labelAbout")
         if label:
             about_text = f"""
@@ -890,6 +970,7 @@ class MainWindow(QtWidgets.QMainWindow):
         dlg.exec()
 
 
+    @asyncSlot(int, int)
     async def _onDetailsCellClicked(self, row: int, col: int):
         if col != 1:
             return
@@ -912,17 +993,32 @@ class MainWindow(QtWidgets.QMainWindow):
                 )
                 return
             
+            from group_detail_dialog import GroupDetailDialog
             dlg = GroupDetailDialog(parent_id, group_svc, parent=self)
             dlg.exec()
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Error", f"Failed to fetch group connection: {e}")
 
+    @asyncSlot()
     async def refreshServicesAsync(self):
         if not self.client:
             QtWidgets.QMessageBox.information(
                 self, "Not Connected", "Not connected to a remote VideoIPath system."
             )
             return
+        # A newer refresh supersedes any still in flight, so stale results are never applied
+        if self._refreshTask is not None and not self._refreshTask.done():
+            self._refreshTask.cancel()
+        task = asyncio.ensure_future(self._doRefresh())
+        self._refreshTask = task
+        try:
+            await task
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise
+            logger.debug("Service refresh superseded by a newer one")
+
+    async def _doRefresh(self):
         self.startLoadingAnimation()
         self.statusMsgLabel.setText("Refreshing services...")
         try:
@@ -932,165 +1028,178 @@ class MainWindow(QtWidgets.QMainWindow):
             self.onServicesError(str(e))
         except Exception as e:
             self.onServicesError(f"Unexpected error: {str(e)}")
-        finally:
-            self.stopLoadingAnimation()
-            self.statusMsgLabel.setText("Services refreshed")
-            await asyncio.sleep(3)
+        # Not in a finally: a cancelled refresh must leave the spinner and status
+        # to the refresh that replaced it
+        self.stopLoadingAnimation()
+        self.statusMsgLabel.setText("Services refreshed")
+        # Clear the message from a timer rather than keeping this coroutine alive for it
+        schedule_ui_task(self._clearRefreshStatus, 3000)
+
+    def _clearRefreshStatus(self):
+        # Leave the label alone if a newer operation has replaced the message since
+        if self.statusMsgLabel.text() == "Services refreshed":
             self.statusMsgLabel.setText("")
 
-    async def _fetchServicesData(self) -> dict:
-        future_normal = self._run_api_call(self.client.retrieve_services)
-        future_profiles = self._run_api_call(self.client.get_profiles)
-        future_endpoint_map = self._run_api_call(self.client.get_endpoint_map)  # see next refactoring
-        future_group = self._run_api_call(self.client.retrieve_group_connections)
-        
-        normal_services, profiles_resp, endpoint_map, group_res = await asyncio.gather(
-            future_normal, future_profiles, future_endpoint_map, future_group
-        )
-        
-        return {
-            "normal_services": normal_services,
-            "profiles_resp": profiles_resp,
-            "endpoint_map": endpoint_map,
-            "group_res": group_res,
-        }
-
-    def _processServicesData(self, responses: dict) -> dict:
-        normal_services = responses["normal_services"]
-        profiles_resp = responses["profiles_resp"]
-        endpoint_map = responses["endpoint_map"]
-        group_res = responses["group_res"]
-        group_services, child_to_group = group_res
-
-        merged = {}
-        merged.update(normal_services)
-        merged.update(group_services)
-        for svc_id, svc_obj in normal_services.items():
-            if svc_id in child_to_group:
-                svc_obj["groupParent"] = child_to_group[svc_id]
-
-        used_profile_ids = set()
-        for svc_data in merged.values():
-            booking = svc_data.get("booking", {})
-            pid = booking.get("profile", "")
-            if pid:
-                used_profile_ids.add(pid)
-
-        prof_data = profiles_resp.get("data", {}).get("config", {}).get("profiles", {})
-        profile_mapping = {pid: info.get("name", pid) for pid, info in prof_data.items()}
-
-        return {
-            "merged": merged,
-            "used_profile_ids": used_profile_ids,
-            "profile_mapping": profile_mapping,
-            "endpoint_map": endpoint_map,
-            "child_to_group": child_to_group,
-        }
-
-    async def _run_api_call(self, func, *args, timeout=10, retries=2):
-        loop = asyncio.get_running_loop()
-        for attempt in range(retries):
-            try:
-                return await asyncio.wait_for(loop.run_in_executor(self.executor, func, *args), timeout)
-            except Exception as e:
-                if attempt == retries - 1:
-                    raise e
+    def _ensure_spinner(self):
+        """Create the spinner QMovie on first use."""
+        if self.loadingMovie is None:
+            self.loadingMovie = QtGui.QMovie(self._SPINNER_PATH, parent=self)
+            self.loadingLabel.setMovie(self.loadingMovie)
+        return self.loadingMovie
 
     def startLoadingAnimation(self):
-        if hasattr(self, "loadingMovie"):
-            self.loadingLabel.setVisible(True)
-            self.loadingMovie.start()
+        self._ensure_spinner()
+        self.loadingLabel.setVisible(True)
+        self.loadingMovie.start()
 
     def stopLoadingAnimation(self):
-        if hasattr(self, "loadingMovie"):
+        if self.loadingMovie is not None:
             self.loadingMovie.stop()
-            self.loadingLabel.setVisible(False)
+        self.loadingLabel.setVisible(False)
 
     def onServicesRetrieved(self, result):
-        merged = result["merged"]
+        table_services = result["table_services"]
         used_profile_ids = result["used_profile_ids"]
         
-        # Create a model with six columns in the specified order
-        new_model = QtGui.QStandardItemModel(self)
-        new_model.setHorizontalHeaderLabels(["Service ID", "Source", "Destination", "Profile", "Created By", "Start"])
+        # Bound once; the loop below runs for every service
+        profile_name = self.service_manager.profile_mapping.get
+        split_label = _split_label
+        as_timestamp = _as_timestamp
+        rows = []
+        add_row = rows.append
         
-        # Only add non-group based services to the table
-        for svc_id, svc_data in merged.items():
-            if svc_data.get("type", "") == "group":
-                continue  # Skip group-based connections
+        # Group-based connections were already left out by the service manager
+        for svc_id, svc_data in table_services:
             booking = svc_data.get("booking", {})
             label = booking.get("descriptor", {}).get("label", "")
-            match = re.match(r'(.+?)\s*->\s*(.+)', label)
-            if match:
-                src = match.group(1).strip()
-                dst = match.group(2).strip()
-            else:
-                src = label
-                dst = ""
+            src, dst = split_label(label)
             pid = booking.get("profile", "")
-            prof_name = self.service_manager.profile_mapping.get(pid, pid)
+            prof_name = profile_name(pid, pid)
             created_by = booking.get("createdBy", "")
             
-            # Process start time: store display text and raw timestamp for sorting
-            start_ts = booking.get("start")
-            start_str = ""
-            timestamp_value = None
-            if start_ts:
-                try:
-                    dt_val = datetime.fromtimestamp(int(start_ts) / 1000)
-                    start_str = dt_val.strftime("%d-%m-%Y - %H:%M:%S")
-                    timestamp_value = int(start_ts)
-                except Exception:
-                    pass
+            # Start times are formatted below, once per distinct timestamp
+            timestamp_value = as_timestamp(booking.get("start"))
             
-            # Create QStandardItem for the Start column and store the raw timestamp in UserRole
-            start_item = QtGui.QStandardItem(start_str)
-            if timestamp_value is not None:
-                start_item.setData(timestamp_value, QtCore.Qt.ItemDataRole.UserRole)
-            
-            row_items = [
-                QtGui.QStandardItem(str(booking.get("serviceId", svc_id))),
-                QtGui.QStandardItem(src),
-                QtGui.QStandardItem(dst),
-                QtGui.QStandardItem(str(prof_name)),
-                QtGui.QStandardItem(created_by),
-                start_item,
-            ]
-            new_model.appendRow(row_items)
+            add_row((str(booking.get("serviceId", svc_id)), src, dst, str(prof_name),
+                     created_by, timestamp_value))
+        
+        # Bookings are typically made in batches and share start times, so format
+        # each distinct timestamp once (memoized across refreshes) and look the text up per row
+        start_strings = {}
+        for timestamp_value in {row[5] for row in rows}:
+            if timestamp_value is None:
+                continue
+            try:
+                start_strings[timestamp_value] = _format_start_ms(timestamp_value)
+            except (OverflowError, OSError, ValueError):
+                pass
         
-        self.filterProxy.setSourceModel(new_model)
-        self.serviceModel = new_model
+        self._syncServiceModel(rows, start_strings)
 
         self._rebuildProfileCheckboxes(used_profile_ids)
         self._setTableViewColumnWidths()
         
         # Update the total services count
-        total_services = len([svc for svc in merged.values() if svc.get("type", "") != "group"])
+        total_services = len(rows)
         self.labelServiceCount.setText(f"Total services: {total_services}")
 
         self.update_table_fonts()
 
+    def _syncServiceModel(self, rows, start_strings):
+        """
+        Bring the persistent service model in line with the freshly fetched rows.
+        Vanished services are removed, surviving ones updated in place and new ones
+        appended, so the proxy mapping and the view's selection survive a refresh.
+        """
+        model = self.serviceModel
+        if model.columnCount() != 6:
+            model.setColumnCount(6)
+            model.setHorizontalHeaderLabels(["Service ID", "Source", "Destination", "Profile", "Created By", "Start"])
+        
+        # Remove rows for services that are gone, bottom-up in contiguous runs
+        new_ids = {row[0] for row in rows}
+        stale_rows = sorted((r for sid, r in self._idToSourceRow.items() if sid not in new_ids), reverse=True)
+        i = 0
+        while i < len(stale_rows):
+            end = stale_rows[i]
+            start = end
+            i += 1
+            while i < len(stale_rows) and stale_rows[i] == start - 1:
+                start -= 1
+                i += 1
+            model.removeRows(start, end - start + 1)
+        
+        # Surviving rows keep their relative order; re-read the ids to get their new positions
+        id_item = model.item
+        id_to_row = {id_item(r, 0).text(): r for r in range(model.rowCount())}
+        added = [sid for sid in dict.fromkeys(row[0] for row in rows) if sid not in id_to_row]
+        if added:
+            first = model.rowCount()
+            model.insertRows(first, len(added))
+            for offset, sid in enumerate(added):
+                id_to_row[sid] = first + offset
+        
+        # Fill cells with signals blocked and announce the whole table once afterwards;
+        # per-cell dataChanged would make the proxy re-filter for every cell
+        item_cls = QtGui.QStandardItem
+        set_item = model.setItem
+        user_role = QtCore.Qt.ItemDataRole.UserRole
+        changed = bool(stale_rows or added)
+        model.blockSignals(True)
+        try:
+            for service_id, src, dst, prof_name, created_by, timestamp_value in rows:
+                r = id_to_row[service_id]
+                # The Start item keeps the raw timestamp in UserRole for sorting
+                start_str = start_strings.get(timestamp_value)
+                start_data = timestamp_value if start_str is not None else None
+                texts = (service_id, src, dst, prof_name, created_by, start_str or "")
+                for col, text in enumerate(texts):
+                    item = id_item(r, col)
+                    if item is None:
+                        item = item_cls(text)
+                        set_item(r, col, item)
+                    elif item.text() != text:
+                        item.setText(text)
+                    elif col != 5 or item.data(user_role) == start_data:
+                        continue
+                    if col == 5:
+                        item.setData(start_data, user_role)
+                    changed = True
+        finally:
+            model.blockSignals(False)
+        
+        self._idToSourceRow = id_to_row
+        if changed and model.rowCount():
+            model.dataChanged.emit(model.index(0, 0), model.index(model.rowCount() - 1, model.columnCount() - 1))
+
     def onServicesError(self, error_msg):
         QtWidgets.QMessageBox.critical(self, "Error Refreshing Services", error_msg)
         self.statusMsgLabel.setText("Error refreshing services")
         schedule_ui_task(lambda: self.statusMsgLabel.setText(""), 3000)
 
     def displayServiceDetails(self, svc_id: str):
-        self.tableWidgetServiceDetails.setRowCount(0)
+        table = self.tableWidgetServiceDetails
+        table.setRowCount(0)
         
         try:
             details = self.service_manager.get_service_details(svc_id)
-            
-            for field, val in details:
-                r = self.tableWidgetServiceDetails.rowCount()
-                self.tableWidgetServiceDetails.insertRow(r)
-                
+        except ServiceManagerError as e:
+            QtWidgets.QMessageBox.warning(self, "Error", str(e))
+            return
+        
+        # Size the table once and fill it without intermediate repaints or cellChanged signals
+        table.setRowCount(len(details))
+        item_flags = QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            for r, (field, val) in enumerate(details):
                 item_field = QtWidgets.QTableWidgetItem(field)
-                item_field.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable)
-                self.tableWidgetServiceDetails.setItem(r, 0, item_field)
+                item_field.setFlags(item_flags)
+                table.setItem(r, 0, item_field)
                 
                 item_val = QtWidgets.QTableWidgetItem(val)
-                item_val.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable)
+                item_val.setFlags(item_flags)
                 
                 # Handle group parent links
                 is_link = False
@@ -1108,9 +1217,10 @@ class MainWindow(QtWidgets.QMainWindow):
                     if user_data is not None:
                         item_val.setData(QtCore.Qt.ItemDataRole.UserRole, user_data)
                         
-                self.tableWidgetServiceDetails.setItem(r, 1, item_val)
-        except ServiceManagerError as e:
-            QtWidgets.QMessageBox.warning(self, "Error", str(e))
+                table.setItem(r, 1, item_val)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
 
     def _setTableViewColumnWidths(self):
         header = self.tableViewServices.horizontalHeader()
@@ -1133,21 +1243,14 @@ class MainWindow(QtWidgets.QMainWindow):
         desc = booking.get("descriptor", {})
         label = desc.get("label","")
 
-        match = re.match(r'(.+?)\s*->\s*(.+)', label)
-        if match:
-            src = match.group(1).strip()
-            dst = match.group(2).strip()
-        else:
-            src = label
-            dst = ""
+        src, dst = _split_label(label)
 
         start_ts = booking.get("start")
         start_str = ""
         if start_ts:
             try:
-                dt_val = datetime.fromtimestamp(int(start_ts)/1000)
-                start_str = dt_val.strftime("%Y-%m-%d %H:%M:%S")  # updated format
-            except Exception:
+                start_str = _format_epoch_ms(int(start_ts))
+            except (TypeError, ValueError, OverflowError, OSError):
                 pass
 
         pid = booking.get("profile","")
@@ -1162,43 +1265,77 @@ class MainWindow(QtWidgets.QMainWindow):
         ]
         self.serviceModel.appendRow(row_items)
 
-    def checkSession(self):
-        if not self.client:
+    @asyncSlot()
+    async def checkSession(self):
+        client = self.client
+        if not client or self._sessionCheckRunning:
             return
+        # The GET can hang on an unreachable server; keep it off the UI thread
+        self._sessionCheckRunning = True
+        loop = asyncio.get_running_loop()
         try:
-            if not self.client.validate_session():
+            valid = await asyncio.wait_for(
+                loop.run_in_executor(self.executor, client.validate_session),
+                self._SESSION_CHECK_INTERVAL
+            )
+        except asyncio.TimeoutError:
+            # Inconclusive; the next tick or refocus tries again
+            logger.warning("Session check timed out")
+            return
+        except VideoIPathClientError as e:
+            if self.client is client:
                 self.updateConnectionStatus(False)
                 self.client = None
-                QtWidgets.QMessageBox.warning(self, "Session Expired", "Your session has expired. Please log in again.")
-        except VideoIPathClientError as e:
+                QtWidgets.QMessageBox.warning(self, "Session Check Failed", str(e))
+            return
+        finally:
+            self._sessionCheckRunning = False
+        # The user may have logged out or in again while the check was in flight
+        if self.client is not client:
+            return
+        if valid:
+            self._lastSessionCheck = time.monotonic()
+        else:
             self.updateConnectionStatus(False)
             self.client = None
-            QtWidgets.QMessageBox.warning(self, "Session Check Failed", str(e))
+            QtWidgets.QMessageBox.warning(self, "Session Expired", "Your session has expired. Please log in again.")
 
     def _rebuildProfileCheckboxes(self, used_profile_ids):
-        while self.layoutProfiles.count() > 0:
-            item = self.layoutProfiles.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-        self.profileCheckBoxes.clear()
-
-        sorted_pids = sorted(used_profile_ids, 
-                        key=lambda pid: self.service_manager.profile_mapping.get(pid, pid).lower())
-        for pid in sorted_pids:
-            pname = self.service_manager.profile_mapping.get(pid, pid)
-            cb = QtWidgets.QCheckBox(pname, self.scrollAreaWidgetProfilesFilters)
-            cb.stateChanged.connect(self.onProfilesFilterChanged)
-            self.layoutProfiles.addWidget(cb)
-            self.profileCheckBoxes.append((cb, pname))
+        # Suspend painting so the whole rebuild costs one layout pass and one repaint
+        container = self.scrollAreaWidgetProfilesFilters
+        container.setUpdatesEnabled(False)
+        try:
+            while self.layoutProfiles.count() > 0:
+                item = self.layoutProfiles.takeAt(0)
+                w = item.widget()
+                if w:
+                    w.deleteLater()
+            self.profileCheckBoxes.clear()
+
+            profile_name = self.service_manager.profile_mapping.get
+            sorted_pids = sorted(used_profile_ids, key=lambda pid: profile_name(pid, pid).lower())
+            for pid in sorted_pids:
+                pname = profile_name(pid, pid)
+                cb = QtWidgets.QCheckBox(pname, container)
+                cb.stateChanged.connect(self.onProfilesFilterChanged)
+                self.layoutProfiles.addWidget(cb)
+                self.profileCheckBoxes.append((cb, pname))
+        finally:
+            container.setUpdatesEnabled(True)
 
     def onSourceFilterChanged(self, text: str):
-        self.filterProxy.setSourceFilterText(text)
-        schedule_ui_task(self.updateServiceSelection)
+        self._filterTimer.start()
 
     def onDestinationFilterChanged(self, text: str):
-        self.filterProxy.setDestinationFilterText(text)
-        schedule_ui_task(self.updateServiceSelection)
+        self._filterTimer.start()
+
+    def _applyTextFilters(self):
+        # Runs once per typing burst; a burst that ends on an equivalent filter costs nothing
+        if self.filterProxy.setTextFilters(
+            self.lineEditSourceFilter.text(),
+            self.lineEditDestinationFilter.text()
+        ):
+            self.updateServiceSelection()
 
     def onTimeFilterChanged(self):
         if self.checkBoxEnableTimeFilter.isChecked():
@@ -1258,16 +1395,12 @@ class MainWindow(QtWidgets.QMainWindow):
         selected_index = selection[0]
         service_id = self.filterProxy.index(selected_index.row(), 0).data()
 
-        found = False
         new_index = None
-        for row in range(self.filterProxy.rowCount()):
-            idx = self.filterProxy.index(row, 0)
-            if idx.data() == service_id:
-                found = True
-                new_index = idx
-                break
+        source_row = self._idToSourceRow.get(service_id)
+        if source_row is not None:
+            new_index = self.filterProxy.mapFromSource(self.serviceModel.index(source_row, 0))
 
-        if not found:
+        if new_index is None or not new_index.isValid():
             self.tableViewServices.clearSelection()
             self.tableWidgetServiceDetails.setRowCount(0)
         else:
@@ -1295,7 +1428,13 @@ def main():
     exception_handler.set_application(app)
     exception_handler.install_global_handler()
     
+    # qasync drives asyncio from Qt's own event dispatcher (socket notifiers and
+    # timers, no polling). Qt's native QtAsyncio is PySide6-only, so qasync stays
+    # the bridge for this PyQt6 app.
     loop = QEventLoop(app)
+    # Slots run Qt work (model swaps, dialogs) as loop callbacks; in asyncio debug mode
+    # the default 100 ms threshold flags those as slow callbacks on every refresh
+    loop.slow_callback_duration = 0.25
     asyncio.set_event_loop(loop)
     
     # Initialize splash screen
@@ -1320,6 +1459,7 @@ def main():
     schedule_ui_task(ensure_remote_systems_config, 500)
     
     # Check for updates using the ApplicationUpdater
+    from application_updater import ApplicationUpdater
     updater = ApplicationUpdater(main_window, splash_manager)
     updater.check_for_updates_async()
     
@@ -1,17 +1,54 @@
 import asyncio
 import json
 import logging
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used when it is absent
+    orjson = None
+import random
+import requests
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set, Tuple, Any
-from vipclient import VideoIPathClient
+from vipclient import VideoIPathClient, VideoIPathClientError
 
 logger = logging.getLogger(__name__)
 
+# Buffer size for service export files, which can run to several MB
+_FILE_BUFFER_SIZE = 64 * 1024
+
+# A refresh fans out four API calls plus the merge step; leave headroom for
+# the retried calls and a concurrent create/cancel without idling dozens of threads
+_API_WORKERS = 8
+
 class ServiceManagerError(Exception):
     """Exception raised for errors in the ServiceManager."""
     pass
 
+# Failures worth retrying: timeouts and dropped/refused connections. HTTP error
+# statuses, auth failures and programming errors are raised immediately.
+_TRANSIENT_ERRORS = (
+    asyncio.TimeoutError,
+    ConnectionError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Check whether an API call failure is transient and worth retrying.
+    VideoIPathClientError is judged by the request exception it wraps.
+    
+    Args:
+        error: The exception raised by the API call.
+        
+    Returns:
+        True if the call may succeed when retried.
+    """
+    if isinstance(error, VideoIPathClientError):
+        error = error.__cause__
+    return isinstance(error, _TRANSIENT_ERRORS)
+
 class ServiceManager:
     """
     Manages service operations including retrieval, creation, cancellation, and persistence.
@@ -26,12 +63,16 @@ class ServiceManager:
             client: An optional VideoIPathClient instance for communication with the server.
         """
         self.client = client
-        self.executor = ThreadPoolExecutor()
+        self.executor = ThreadPoolExecutor(max_workers=_API_WORKERS, thread_name_prefix="vip-api")
         self.current_services = {}
         self.profile_mapping = {}
         self.endpoint_map = {}
         self.child_to_group = {}
     
+    def shutdown(self) -> None:
+        """Stop accepting work and let idle API threads exit without waiting on in-flight calls."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+    
     def set_client(self, client: VideoIPathClient) -> None:
         """
         Set or update the VideoIPathClient instance.
@@ -55,7 +96,7 @@ class ServiceManager:
             The result of the function call.
             
         Raises:
-            Exception: If all retries fail.
+            Exception: Immediately for non-transient errors, or the last error once retries run out.
         """
         loop = asyncio.get_running_loop()
         for attempt in range(retries):
@@ -65,9 +106,11 @@ class ServiceManager:
                     timeout
                 )
             except Exception as e:
-                if attempt == retries - 1:
-                    raise e
-                logger.warning(f"API call failed, retrying ({attempt+1}/{retries}): {e}")
+                if attempt == retries - 1 or not is_transient_error(e):
+                    raise
+                logger.warning("API call failed, retrying (%d/%d): %s", attempt + 1, retries, e)
+                # Exponential backoff with full jitter
+                await asyncio.sleep(random.uniform(0, 0.1 * 2 ** attempt))
     
     async def fetch_services_data(self) -> Dict[str, Any]:
         """
@@ -96,30 +139,11 @@ class ServiceManager:
         except Exception as e:
             raise ServiceManagerError(f"Failed to fetch services data: {e}")
         
-        # Process the results
-        group_services, child_to_group = group_res
-        
-        # Merge normal and group services
-        merged = {}
-        merged.update(normal_services)
-        merged.update(group_services)
-        
-        # Add group parent info to child services
-        for svc_id, svc_obj in normal_services.items():
-            if svc_id in child_to_group:
-                svc_obj["groupParent"] = child_to_group[svc_id]
-        
-        # Extract profile information
-        used_profile_ids = set()
-        for svc_data in merged.values():
-            booking = svc_data.get("booking", {})
-            pid = booking.get("profile", "")
-            if pid:
-                used_profile_ids.add(pid)
-        
-        # Create profile mapping
-        prof_data = profiles_resp.get("data", {}).get("config", {}).get("profiles", {})
-        profile_mapping = {pid: info.get("name", pid) for pid, info in prof_data.items()}
+        # Merging and scanning large service dicts is CPU-bound; keep it off the event loop thread
+        loop = asyncio.get_running_loop()
+        merged, table_services, used_profile_ids, profile_mapping, child_to_group = await loop.run_in_executor(
+            self.executor, self._process_services_data, normal_services, profiles_resp, group_res
+        )
         
         # Update instance variables
         self.current_services = merged
@@ -129,12 +153,60 @@ class ServiceManager:
         
         return {
             "merged": merged,
+            "table_services": table_services,
             "used_profile_ids": used_profile_ids,
             "profile_mapping": profile_mapping,
             "endpoint_map": endpoint_map,
             "child_to_group": child_to_group,
         }
     
+    @staticmethod
+    def _process_services_data(normal_services: Dict[str, Any], profiles_resp: Dict[str, Any],
+                               group_res: Tuple[Dict[str, Any], Dict[str, str]]):
+        """
+        Merge the raw API responses. Pure data processing, safe to run in a worker thread.
+        
+        Args:
+            normal_services: Endpoint-based services keyed by service id.
+            profiles_resp: Raw profiles API response.
+            group_res: Tuple of (group services, child-to-group mapping).
+            
+        Returns:
+            Tuple of (merged services, (id, service) pairs for the table, used profile ids,
+            profile mapping, child-to-group mapping). Group-based connections are not
+            shown in the table, so they are left out of the table pairs.
+        """
+        group_services, child_to_group = group_res
+        
+        # Merge the services, tag group children and collect used profiles in one pass each
+        merged = {}
+        used_profile_ids = set()
+        for svc_id, svc_obj in normal_services.items():
+            parent = child_to_group.get(svc_id)
+            if parent is not None:
+                svc_obj["groupParent"] = parent
+            merged[svc_id] = svc_obj
+            # A group service with the same id replaces this entry below
+            if svc_id not in group_services:
+                pid = svc_obj.get("booking", {}).get("profile", "")
+                if pid:
+                    used_profile_ids.add(pid)
+        for svc_id, svc_obj in group_services.items():
+            merged[svc_id] = svc_obj
+            pid = svc_obj.get("booking", {}).get("profile", "")
+            if pid:
+                used_profile_ids.add(pid)
+        
+        table_services = [(svc_id, svc_obj) for svc_id, svc_obj in merged.items()
+                          if svc_obj.get("type", "") != "group"]
+        
+        # Create profile mapping
+        prof_data = profiles_resp.get("data", {}).get("config", {}).get("profiles", {})
+        # Only the profiles some service uses are ever looked up; lookups fall back to the id
+        profile_mapping = {pid: prof_data[pid].get("name", pid) for pid in used_profile_ids if pid in prof_data}
+        
+        return merged, table_services, used_profile_ids, profile_mapping, child_to_group
+    
     def get_service(self, service_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a service by ID.
@@ -295,6 +367,39 @@ class ServiceManager:
             logger.error(f"Error fetching group connection {group_id}: {e}")
             return None
     
+    @staticmethod
+    def _write_services_file(services: Dict[str, Any], file_path: str) -> None:
+        """
+        Serialize services and write them to disk. Blocking; runs on the executor.
+        
+        Args:
+            services: Dictionary of services to save.
+            file_path: Path to save the services to.
+        """
+        if orjson is not None:
+            with open(file_path, "wb", buffering=_FILE_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(services, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, "w", encoding="utf-8", buffering=_FILE_BUFFER_SIZE) as f:
+                json.dump(services, f, indent=2)
+    
+    @staticmethod
+    def _read_services_file(file_path: str) -> Dict[str, Any]:
+        """
+        Read and parse a services file. Blocking; runs on the executor.
+        
+        Args:
+            file_path: Path to load services from.
+            
+        Returns:
+            Dictionary of loaded services.
+        """
+        if orjson is not None:
+            with open(file_path, "rb", buffering=_FILE_BUFFER_SIZE) as f:
+                return orjson.loads(f.read())
+        with open(file_path, "r", encoding="utf-8", buffering=_FILE_BUFFER_SIZE) as f:
+            return json.load(f)
+    
     async def save_services(self, services: Dict[str, Any], file_path: str) -> None:
         """
         Save services to a file.
@@ -306,9 +411,10 @@ class ServiceManager:
         Raises:
             ServiceManagerError: If saving fails.
         """
+        # Serializing and writing a multi-MB export would stall the UI; do both off the loop thread
+        loop = asyncio.get_running_loop()
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(services, f, indent=2)
+            await loop.run_in_executor(self.executor, self._write_services_file, services, file_path)
         except Exception as e:
             raise ServiceManagerError(f"Failed to save services: {e}")
     
@@ -325,9 +431,9 @@ class ServiceManager:
         Raises:
             ServiceManagerError: If loading fails.
         """
+        loop = asyncio.get_running_loop()
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return await loop.run_in_executor(self.executor, self._read_services_file, file_path)
         except Exception as e:
             raise ServiceManagerError(f"Failed to load services: {e}")
     
@@ -503,29 +609,35 @@ class ServiceManager:
             ServiceManagerError: If any service is not found.
         """
         modern_services_to_save = {}
+        get_service = self.current_services.get
+        get_profile_name = self.profile_mapping.get
         
         for service_id in service_ids:
-            service_data = self.current_services.get(service_id)
+            service_data = get_service(service_id)
             if not service_data:
                 raise ServiceManagerError(f"Service {service_id} not found")
             
-            booking = service_data.get("booking", {})
+            # Read each booking field once
+            booking_get = service_data.get("booking", {}).get
+            from_device = booking_get("from", "")
+            to_device = booking_get("to", "")
             
             # Extract device labels from descriptor label if formatted as "Source -> Destination"
-            descriptor = booking.get("descriptor", {})
-            descriptor_label = descriptor.get("label", "")
+            descriptor_get = booking_get("descriptor", {}).get
+            descriptor_label = descriptor_get("label", "")
             
-            if "->" in descriptor_label:
-                parts = descriptor_label.split("->")
-                from_label = parts[0].strip()
-                to_label = parts[1].strip() if len(parts) > 1 else ""
+            left, sep, right = descriptor_label.partition("->")
+            if sep:
+                from_label = left.strip()
+                # Anything after a second "->" is not part of the destination label
+                to_label = right.partition("->")[0].strip()
             else:
-                from_label = booking.get("from", "")
-                to_label = booking.get("to", "")
+                from_label = from_device
+                to_label = to_device
             
             # Get profile id and then the profile name from the mapping
-            profile_id = booking.get("profile", "")
-            profile_name = self.profile_mapping.get(profile_id, profile_id) if profile_id else ""
+            profile_id = booking_get("profile", "")
+            profile_name = get_profile_name(profile_id, profile_id) if profile_id else ""
             
             modern_entry = {
                 "scheduleInfo": {
@@ -535,18 +647,18 @@ class ServiceManager:
                 },
                 "locked": False,
                 "serviceDefinition": {
-                    "from": booking.get("from", ""),
-                    "to": booking.get("to", ""),
+                    "from": from_device,
+                    "to": to_device,
                     "fromLabel": from_label,
                     "toLabel": to_label,
-                    "allocationState": booking.get("allocationState", 0),
+                    "allocationState": booking_get("allocationState", 0),
                     "descriptor": {
-                        "desc": descriptor.get("desc", ""),
+                        "desc": descriptor_get("desc", ""),
                         "label": descriptor_label
                     },
                     "profileId": profile_id,
                     "profileName": profile_name,
-                    "tags": booking.get("tags", []),
+                    "tags": booking_get("tags", []),
                     "type": "connection",
                     "ctype": 2
                 }
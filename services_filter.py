@@ -1,21 +1,94 @@
 import re
 from PyQt6 import QtCore
 
+_OR_RE = re.compile(r'\bOR\b')
+_AND_RE = re.compile(r'\bAND\b')
+
 class ServicesFilterProxy(QtCore.QSortFilterProxyModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.source_filter = ""
         self.destination_filter = ""
+        self._source_terms = None
+        self._destination_terms = None
         self.start_range = (None, None)
         self.active_profiles = set()
+        # Column-major snapshot of the source rows used by filterAcceptsRow, built lazily
+        self._cols = None
+    
+    def setSourceModel(self, model):
+        old = self.sourceModel()
+        if old is not None:
+            for sig in (old.rowsAboutToBeInserted, old.rowsAboutToBeRemoved, old.modelAboutToBeReset):
+                sig.disconnect(self._invalidateRowCache)
+            old.dataChanged.disconnect(self._onSourceDataChanged)
+        self._cols = None
+        if model is not None:
+            # Connected before the base class hooks up its own dataChanged handler, so the
+            # cache already holds the new values when the proxy re-filters the changed rows
+            model.dataChanged.connect(self._onSourceDataChanged)
+        super().setSourceModel(model)
+        if model is not None:
+            # The "about to" signals fire before the proxy re-filters the affected rows
+            for sig in (model.rowsAboutToBeInserted, model.rowsAboutToBeRemoved, model.modelAboutToBeReset):
+                sig.connect(self._invalidateRowCache)
+    
+    def _invalidateRowCache(self, *args):
+        self._cols = None
+    
+    def _onSourceDataChanged(self, top_left, bottom_right, *args):
+        # Refresh only the changed rows; the proxy's own handler then re-filters that range
+        cols = self._cols
+        if cols is None:
+            return
+        model = self.sourceModel()
+        last = min(bottom_right.row(), len(cols[0]) - 1)
+        for row in range(top_left.row(), last + 1):
+            for col, value in zip(cols, self._rowEntry(model, row)):
+                col[row] = value
+    
+    @staticmethod
+    def _rowEntry(model, row):
+        """Return the cached (source, destination, start, profile) values for one source row."""
+        start_text = model.index(row, 5).data() or ""
+        return (
+            (model.index(row, 1).data() or "").lower(),
+            (model.index(row, 2).data() or "").lower(),
+            QtCore.QDateTime.fromString(start_text, "dd-MM-yyyy - HH:mm:ss") if start_text else None,
+            model.index(row, 3).data() or "",
+        )
+    
+    def _buildRowCache(self):
+        """
+        Snapshot the filtered columns as parallel lists, one entry per source row.
+        Text is lower-cased and start times are parsed once here instead of on every filter pass.
+        """
+        model = self.sourceModel()
+        entries = [self._rowEntry(model, row) for row in range(model.rowCount())]
+        self._cols = tuple(list(col) for col in zip(*entries)) if entries else ([], [], [], [])
+        return self._cols
     
     def setSourceFilterText(self, text):
-        self.source_filter = text
-        self.invalidateFilter()
+        self.setTextFilters(text, self.destination_filter)
     
     def setDestinationFilterText(self, text):
-        self.destination_filter = text
+        self.setTextFilters(self.source_filter, text)
+    
+    def setTextFilters(self, source_text, destination_text):
+        """
+        Set both text filters and re-filter once; the expressions are parsed here, not per row.
+        Returns False without re-filtering when the parsed filters are unchanged.
+        """
+        self.source_filter = source_text
+        self.destination_filter = destination_text
+        source_terms = self.parse_filter(source_text)
+        destination_terms = self.parse_filter(destination_text)
+        if (source_terms, destination_terms) == (self._source_terms, self._destination_terms):
+            return False
+        self._source_terms = source_terms
+        self._destination_terms = destination_terms
         self.invalidateFilter()
+        return True
     
     def setStartRange(self, start_dt, end_dt):
         self.start_range = (start_dt, end_dt)
@@ -25,48 +98,61 @@ class ServicesFilterProxy(QtCore.QSortFilterProxyModel):
         self.active_profiles = set(profile_names)
         self.invalidateFilter()
 
-    def evaluate_filter(self, text, filter_str):
+    @staticmethod
+    def parse_filter(filter_str):
         """
-        Evaluate whether 'text' (already lower case) matches the filter_str.
+        Parse a filter expression into (match function, lower-cased tokens), or None for no filter.
         Supports uppercase "OR" and "AND" as operators, even if not surrounded by spaces.
         If no operator is detected, the filter is treated as a literal substring.
         """
         filter_str = filter_str.strip()
         if not filter_str:
-            return True
+            return None
         # Check for OR operator using word boundaries.
-        if re.search(r'\bOR\b', filter_str):
-            tokens = re.split(r'\bOR\b', filter_str)
-            return any(token.strip().lower() in text for token in tokens if token.strip())
+        if _OR_RE.search(filter_str):
+            tokens = _OR_RE.split(filter_str)
+            return any, tuple(token.strip().lower() for token in tokens if token.strip())
         # Check for AND operator using word boundaries.
-        elif re.search(r'\bAND\b', filter_str):
-            tokens = re.split(r'\bAND\b', filter_str)
-            return all(token.strip().lower() in text for token in tokens if token.strip())
+        elif _AND_RE.search(filter_str):
+            tokens = _AND_RE.split(filter_str)
+            return all, tuple(token.strip().lower() for token in tokens if token.strip())
         else:
-            return filter_str.lower() in text
+            return all, (filter_str.lower(),)
+
+    @staticmethod
+    def _matches(text, terms):
+        """Check already lower-cased 'text' against a parse_filter() result."""
+        if terms is None:
+            return True
+        combine, tokens = terms
+        return combine(token in text for token in tokens)
+
+    def evaluate_filter(self, text, filter_str):
+        """
+        Evaluate whether 'text' (already lower case) matches the filter_str.
+        """
+        return self._matches(text, self.parse_filter(filter_str))
 
     def filterAcceptsRow(self, source_row, source_parent):
-        model = self.sourceModel()
-        # Adjusted column indices based on the current order:
+        # Column indices based on the current order:
         # 0: Service ID, 1: Source, 2: Destination, 3: Profile, 4: Created By, 5: Start
-        idx_source = model.index(source_row, 1, source_parent)
-        idx_dest   = model.index(source_row, 2, source_parent)
-        idx_start  = model.index(source_row, 5, source_parent)
-        idx_prof   = model.index(source_row, 3, source_parent)
+        cols = self._cols
+        if cols is None or source_row >= len(cols[0]):
+            cols = self._buildRowCache()
+        sources, dests, starts, profiles = cols
     
-        source_text = (model.data(idx_source) or "").lower()
-        dest_text   = (model.data(idx_dest)   or "").lower()
-        start_text  = (model.data(idx_start)  or "")
-        profile_txt = (model.data(idx_prof)   or "")
+        source_text = sources[source_row]
+        dest_text   = dests[source_row]
+        dt_val      = starts[source_row]
+        profile_txt = profiles[source_row]
     
-        if not self.evaluate_filter(source_text, self.source_filter):
+        if not self._matches(source_text, self._source_terms):
             return False
-        if not self.evaluate_filter(dest_text, self.destination_filter):
+        if not self._matches(dest_text, self._destination_terms):
             return False
     
         # Time range filter
-        if start_text:
-            dt_val = QtCore.QDateTime.fromString(start_text, "dd-MM-yyyy - HH:mm:ss")
+        if dt_val is not None:
             if self.start_range[0] and dt_val < self.start_range[0]:
                 return False
             if self.start_range[1] and dt_val > self.start_range[1]:
@@ -2,27 +2,56 @@ import logging
 import os
 import sys
 import ctypes
+from functools import lru_cache
 from PyQt6 import QtGui
 from constants import APP_ID
 from utils import resource_path
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1)
+def get_app_icon():
+    """
+    Return the application icon, decoded from disk on first use and shared afterwards.
+    Uses the multi-size .ico on Windows and the .png on other platforms.
+    
+    Returns:
+        QtGui.QIcon, or None if the icon file is missing
+    """
+    if sys.platform == 'win32':
+        icon_path = resource_path(os.path.join("logos", "viprestore_icon.ico"))
+    else:
+        icon_path = resource_path(os.path.join("logos", "viprestore_icon.png"))
+
+    if not os.path.exists(icon_path):
+        logger.warning(f"Icon file not found: {icon_path}")
+        return None
+    logger.debug(f"Loaded application icon from {icon_path}")
+    return QtGui.QIcon(icon_path)
+
+
 class AppearanceManager:
     """Manages application appearance including fonts, styles, and icons."""
     
     def __init__(self):
         """Initialize the appearance manager."""
         self.loaded_fonts = {}
+        self._fonts_registered = False
         self.app_id = APP_ID
     
     def load_custom_fonts(self):
         """
         Load all required font variants and register them with the application.
+        Fonts are registered once per process; later calls return the same result.
         
         Returns:
             dict: Dictionary of loaded font families by variant name
         """
+        if self._fonts_registered:
+            return self.loaded_fonts
+        self._fonts_registered = True
+
         font_files = {
             'regular': 'Roboto-Regular.ttf',
             'bold': 'Roboto-Bold.ttf',
@@ -30,26 +59,24 @@ class AppearanceManager:
 
         fonts_dir = resource_path("fonts")
         
-        # Debug information
-        logger.debug(f"Looking for fonts in: {fonts_dir}")
+        logger.debug("Looking for fonts in: %s", fonts_dir)
         
+        add_font = QtGui.QFontDatabase.addApplicationFont
+        font_families = QtGui.QFontDatabase.applicationFontFamilies
         for variant, filename in font_files.items():
             font_path = os.path.join(fonts_dir, filename)
-            if not os.path.exists(font_path):
-                logger.warning(f"Font file not found: {font_path}")
-                continue
-
-            font_id = QtGui.QFontDatabase.addApplicationFont(font_path)
+            # addApplicationFont reports a missing file as -1 too, so no separate stat is needed
+            font_id = add_font(font_path)
             if font_id == -1:
-                logger.warning(f"Failed to load font: {filename}")
+                logger.warning("Failed to load font (missing or unreadable): %s", font_path)
                 continue
 
-            families = QtGui.QFontDatabase.applicationFontFamilies(font_id)
+            families = font_families(font_id)
             if families:
                 self.loaded_fonts[variant] = families[0]
-                logger.debug(f"Successfully loaded font: {filename} as {families[0]}")
+                logger.debug("Successfully loaded font: %s as %s", filename, families[0])
             else:
-                logger.warning(f"No font families found for: {filename}")
+                logger.warning("No font families found for: %s", filename)
 
         return self.loaded_fonts
     
@@ -61,8 +88,7 @@ class AppearanceManager:
             app: QApplication instance
             main_window: MainWindow instance
         """
-        if not self.loaded_fonts:
-            self.load_custom_fonts()
+        self.load_custom_fonts()
             
         if 'regular' in self.loaded_fonts:
             app.setFont(QtGui.QFont(self.loaded_fonts['regular'], 10))
@@ -81,20 +107,11 @@ class AppearanceManager:
             app: QApplication instance
             window: MainWindow instance
         """
-        # Determine icon path based on platform
-        if sys.platform == 'win32':
-            icon_path = resource_path(os.path.join("logos", "viprestore_icon.ico"))
-        else:
-            icon_path = resource_path(os.path.join("logos", "viprestore_icon.png"))
-
-        # Create and set the icon if it exists
-        if os.path.exists(icon_path):
-            icon = QtGui.QIcon(icon_path)
+        # The application-wide icon also covers dialogs opened later
+        icon = get_app_icon()
+        if icon is not None:
             app.setWindowIcon(icon)
             window.setWindowIcon(icon)
-            logger.debug(f"Set application icon from {icon_path}")
-        else:
-            logger.warning(f"Icon file not found: {icon_path}")
 
         # OS-specific settings
         if sys.platform.startswith('linux'):
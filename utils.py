@@ -1,12 +1,15 @@
 import os
 import sys
 import logging
+from functools import lru_cache
+from pathlib import Path
 from PyQt6 import QtCore
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
 def resource_path(relative_path):
-    """Return the absolute path to a resource, works in dev and PyInstaller."""
+    """Return the absolute path to a resource, works in dev and PyInstaller. Results are cached."""
     try:
         # PyInstaller stores temp path in _MEIPASS.
         base_path = sys._MEIPASS
@@ -16,20 +19,77 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def size_unit(size_in_bytes: int) -> tuple[int, str]:
+    """
+    Pick the display unit for a byte count.
+    
+    Args:
+        size_in_bytes: Size in bytes
+        
+    Returns:
+        tuple: (denominator, unit name), e.g. (1048576, "MB")
+    """
+    if size_in_bytes < 1024:
+        return 1, _SIZE_UNITS[0]
+    # Each unit step is 2**10, so the bit length picks the unit without a divide loop
+    idx = min((int(size_in_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return 1 << (idx * 10), _SIZE_UNITS[idx]
+
+
+def human_readable_size(size_in_bytes: int) -> str:
+    """
+    Convert bytes to a human-readable string.
+    
+    Args:
+        size_in_bytes: Size in bytes
+        
+    Returns:
+        str: Human readable size (e.g., "4.20 MB")
+    """
+    denom, unit = size_unit(size_in_bytes)
+    return f"{size_in_bytes / denom:.2f} {unit}"
+
+
+def _platform_base_dir() -> Path:
+    """
+    Returns the per-user base directory for application files on this platform.
+    On Windows, uses LOCALAPPDATA; on macOS, uses Application Support; on Linux, uses XDG_CONFIG_HOME.
+    """
+    if sys.platform.startswith("win"):
+        return Path(os.getenv("LOCALAPPDATA", str(Path.home() / "AppData" / "Local")))
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Application Support"
+    return Path(os.getenv("XDG_CONFIG_HOME", str(Path.home() / ".config")))
+
+
+@lru_cache(maxsize=1)
+def get_app_data_dir() -> Path:
+    """
+    Returns a Path object for the user-writable application directory.
+    Logs, configuration and caches all live here.
+    The directory is created on the first call; the result is cached for the life of the process.
+    """
+    from constants import APP_NAME
+
+    data_dir = _platform_base_dir() / APP_NAME
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
+
+
 class UITaskScheduler(QtCore.QObject):
     """
     Scheduler for UI tasks that handles deferred execution properly.
-    Replaces the QTimer.singleShot(0,...) anti-pattern with a more maintainable approach.
+    Each task gets its own single-shot timer, so a long delay never holds back
+    tasks scheduled after it, and exceptions are logged instead of escaping
+    into the event loop.
     """
     
     def __init__(self, parent=None):
         """Initialize the task scheduler."""
         super().__init__(parent)
-        self._timer = QtCore.QTimer(self)
-        self._timer.setSingleShot(True)
-        self._timer.timeout.connect(self._execute_next)
-        self._queue = []
-        self._executing = False
     
     def schedule(self, callback, delay_ms=0):
         """
@@ -39,29 +99,15 @@ class UITaskScheduler(QtCore.QObject):
             callback: Function to call
             delay_ms: Delay in milliseconds, 0 for next event loop iteration
         """
-        self._queue.append(callback)
-        
-        # Start timer if not already running
-        if not self._timer.isActive() and not self._executing:
-            self._timer.start(delay_ms)
+        QtCore.QTimer.singleShot(max(0, delay_ms), lambda: self._execute(callback))
     
-    def _execute_next(self):
-        """Execute the next scheduled task."""
-        if not self._queue:
-            return
-            
-        self._executing = True
+    @staticmethod
+    def _execute(callback):
+        """Run one scheduled task."""
         try:
-            callback = self._queue.pop(0)
             callback()
         except Exception as e:
             logger.error(f"Error in scheduled task: {e}", exc_info=True)
-        finally:
-            self._executing = False
-            
-            # Schedule next task if available
-            if self._queue:
-                self._timer.start(0)
 
 
 # Create singleton instance
@@ -2,9 +2,14 @@ import requests
 import warnings
 import strings
 from requests import Session
+from requests.adapters import HTTPAdapter
 from typing import Optional, Callable, Dict
 from urllib.parse import urlparse
 
+# One client talks to one server, so a single pool sized to the service manager's
+# API worker count keeps every concurrent call on a kept-alive TLS connection
+_POOL_MAXSIZE = 8
+
 class VideoIPathClientError(Exception):
     pass
 
@@ -13,6 +18,9 @@ class VideoIPathClient:
                  ssl_exception_callback: Optional[Callable[[str], bool]] = None) -> None:
         self.base_url = base_url.rstrip("/")
         self.session: Session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_POOL_MAXSIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.verify = verify_ssl
         self.xsrf_token: Optional[str] = None
         self.username: Optional[str] = None
@@ -21,17 +21,30 @@ dist_dir_path = os.path.join("dist", output_dir)
 if os.path.exists(dist_dir_path):
     shutil.rmtree(dist_dir_path)
 
+# Precompile the Qt Designer forms so the frozen app never parses .ui XML at runtime.
+# The modules go into PyInstaller's work directory, not the source tree, so a source
+# checkout never picks up a stale generated form after the .ui file is edited
+ui_gen_dir = os.path.join(workpath, "generated_ui")
+os.makedirs(ui_gen_dir, exist_ok=True)
+for ui_file, py_file in (
+    ("main.ui", "ui_main.py"),
+    ("login_dialog.ui", "ui_login_dialog.py"),
+    ("about_dialog.ui", "ui_about_dialog.py"),
+):
+    subprocess.run(
+        [sys.executable, "-m", "PyQt6.uic.pyuic", ui_file, "-o", os.path.join(ui_gen_dir, py_file)],
+        check=True,
+    )
+
 block_cipher = None
 
 a = Analysis(
     ["main.py"],
-    pathex=[os.getcwd()],
+    pathex=[os.getcwd(), ui_gen_dir],
     binaries=[],
     datas=[
-        # Include the UI files – add more if needed:
-        ("main.ui", "."),
-        ("about_dialog.ui", "."),
-        ("login_dialog.ui", "."),
+        # The .ui files are compiled into ui_*.py modules above and are not bundled; the
+        # app only falls back to parsing .ui files when run from source.
         # Include version file and other resources:
         ("version.txt", "."),
         ("logos/*.ico", "logos"),